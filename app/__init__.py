@@ -2,7 +2,6 @@
 """
 FastAPI Resume Parser Application
 """
-from fastapi import FastAPI
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
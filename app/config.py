@@ -4,11 +4,15 @@ Configuration management for the application.
 Loads all environment variables and provides a centralized config object.
 """
 from pydantic_settings import BaseSettings
-from typing import Optional
+from functools import lru_cache
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# Only read .env once per process tree; reloader and worker processes
+# inherit the populated environment from their parent.
+if not os.environ.get("APP_ENV_LOADED"):
+    load_dotenv()
+    os.environ["APP_ENV_LOADED"] = "1"
 
 
 class Settings(BaseSettings):
@@ -23,6 +27,8 @@ class Settings(BaseSettings):
     SUPABASE_URL: str
     SUPABASE_KEY: str
     SUPABASE_BUCKET_NAME: str = "resumes"
+    SUPABASE_MAX_CONNECTIONS: int = 100
+    SUPABASE_MAX_KEEPALIVE_CONNECTIONS: int = 20
     
     # MongoDB
     MONGODB_URL: str
@@ -33,15 +39,39 @@ class Settings(BaseSettings):
     HUGGINGFACE_API_KEY: str
     HUGGINGFACE_EXTRACTION_MODEL: str = "facebook/bart-large-cnn"
     HUGGINGFACE_QA_MODEL: str = "mistralai/Mistral-7B-Instruct-v0.2"
+    LLM_CACHE_SIZE: int = 512  # entries kept per LLM response cache
+    ANSWER_CACHE_TTL: int = 3600  # seconds a cached Q&A answer is reused
+    GROQ_TIMEOUT: float = 10.0  # seconds per read/write
+    GROQ_CONNECT_TIMEOUT: float = 2.0
+    GROQ_MAX_ATTEMPTS: int = 2  # including the first try
+    GROQ_MAX_CONNECTIONS: int = 200
+    GROQ_MAX_KEEPALIVE_CONNECTIONS: int = 100
+    GROQ_HEDGE_MS: int = 2000  # delay before also asking the fallback Q&A model (0 = ask all at once)
     
     # File Upload
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_EXTENSIONS: list = [".pdf", ".docx"]
+    TEXT_CACHE_SIZE: int = 128  # extracted resume texts kept, keyed by file content
     
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, parsed and validated on first call only.
+    
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Keep `from app.config import settings` working without eager parsing"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,53 @@
+# app/core/dependencies.py
+"""
+Process-wide service instances shared by all routes
+"""
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.services.file_service import FileService
+    from app.services.supabase_service import SupabaseService
+    from app.services.mongodb_service import MongoDBService
+    from app.services.huggingface_service import HuggingFaceService
+
+
+# Each service is imported and created on first use and then reused by every
+# route, so the process holds a single MongoDB pool and a single HTTP client
+# per backend, and the client stacks are not loaded at application import time.
+@lru_cache()
+def get_file_service() -> "FileService":
+    """Dependency for file service"""
+    from app.services.file_service import FileService
+    return FileService()
+
+
+@lru_cache()
+def get_supabase_service() -> "SupabaseService":
+    """Dependency for Supabase service"""
+    from app.services.supabase_service import SupabaseService
+    return SupabaseService()
+
+
+@lru_cache()
+def get_mongodb_service() -> "MongoDBService":
+    """Dependency for MongoDB service"""
+    from app.services.mongodb_service import MongoDBService
+    return MongoDBService()
+
+
+@lru_cache()
+def get_hf_service() -> "HuggingFaceService":
+    """Dependency for HuggingFace (Groq) service"""
+    from app.services.huggingface_service import HuggingFaceService
+    return HuggingFaceService()
+
+
+async def close_services() -> None:
+    """Close clients of the services that were created in this process"""
+    if get_mongodb_service.cache_info().currsize:
+        get_mongodb_service().close()
+    if get_hf_service.cache_info().currsize:
+        await get_hf_service().close()
+    if get_supabase_service.cache_info().currsize:
+        await get_supabase_service().close()
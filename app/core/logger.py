@@ -4,7 +4,12 @@ Centralized logging configuration for the application
 """
 import logging
 import sys
-from pathlib import Path
+
+# One formatter shared by every handler this module creates
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -25,13 +30,7 @@ def get_logger(name: str) -> logging.Logger:
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
-        
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
         
         logger.addHandler(console_handler)
     
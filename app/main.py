@@ -4,17 +4,22 @@ Main FastAPI application entry point
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.config import settings
+from fastapi.responses import ORJSONResponse
+from app.config import get_settings
 from app.routes import upload, candidates, qa
 from app.core.logger import get_logger
+from app.core.dependencies import close_services, get_mongodb_service
+import asyncio
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
-    description="Resume Parser API with ML-powered extraction and Q&A"
+    description="Resume Parser API with ML-powered extraction and Q&A",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -32,29 +37,40 @@ app.include_router(candidates.router, tags=["Candidates"])
 app.include_router(qa.router, tags=["Q&A"])
 
 
+# Static bodies for the root and health endpoints are rendered once; liveness
+# probes then skip serialization entirely.
+_ROOT_RESPONSE = ORJSONResponse({
+    "message": "Resume Parser API",
+    "version": settings.APP_VERSION,
+    "status": "running"
+})
+_HEALTH_RESPONSE = ORJSONResponse({"status": "healthy"})
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Resume Parser API",
-        "version": settings.APP_VERSION,
-        "status": "running"
-    }
+    return _ROOT_RESPONSE
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy"}
+    return _HEALTH_RESPONSE
 
 
 @app.on_event("startup")
 async def startup_event():
     """Run on application startup"""
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
+    # Index creation runs in the background so an unreachable database
+    # doesn't hold up startup; failures are logged by the service
+    app.state.index_task = asyncio.create_task(get_mongodb_service().ensure_indexes())
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown"""
-    logger.info(f"Shutting down {settings.APP_NAME}")
\ No newline at end of file
+    logger.info(f"Shutting down {settings.APP_NAME}")
+    app.state.index_task.cancel()
+    await close_services()
\ No newline at end of file
@@ -4,6 +4,7 @@ Pydantic schemas for request/response validation
 """
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
+from typing_extensions import TypedDict
 from datetime import datetime
 
 
@@ -44,17 +45,19 @@ class CandidateCreate(BaseModel):
     introduction: str = ""
 
 
-class CandidateSummary(BaseModel):
+# Read-side shapes are TypedDicts: they are built from our own MongoDB
+# documents and returned as plain dicts, so no per-row validation is needed.
+class CandidateSummary(TypedDict):
     """Summary view of candidate"""
     id: str
     candidate_id: str
-    name: Optional[str] = None
+    name: Optional[str]
     skills: List[str]
-    experience_years: Optional[str] = None
-    created_at: Optional[datetime] = None
+    experience_years: Optional[str]
+    created_at: Optional[datetime]
 
 
-class CandidateDetail(BaseModel):
+class CandidateDetail(TypedDict):
     """Full candidate information"""
     id: str
     candidate_id: str
@@ -65,7 +68,7 @@ class CandidateDetail(BaseModel):
     certifications: List[str]
     projects: List[str]
     introduction: str
-    created_at: Optional[datetime] = None
+    created_at: Optional[datetime]
 
 
 class QuestionRequest(BaseModel):
@@ -2,73 +2,119 @@
 """
 Candidate listing and detail endpoints
 """
-from fastapi import APIRouter, HTTPException, Path
-from typing import List
+from fastapi import APIRouter, HTTPException, Path, Query, Depends
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from typing import AsyncIterator, List, TYPE_CHECKING
+import orjson
+from app.config import get_settings
 from app.models.schemas import CandidateSummary, CandidateDetail
-from app.services.mongodb_service import MongoDBService
 from app.core.logger import get_logger
+from app.core.dependencies import get_mongodb_service
+
+if TYPE_CHECKING:
+    from app.services.mongodb_service import MongoDBService
 
 router = APIRouter()
 logger = get_logger(__name__)
 
-mongodb_service = MongoDBService()
+# Responses are built from trusted MongoDB documents without validation.
+# In DEBUG mode they are still checked against the declared shapes so that
+# drift in the stored documents shows up during development.
+if get_settings().DEBUG:
+    _summaries_adapter = TypeAdapter(List[CandidateSummary])
+    _summary_adapter = TypeAdapter(CandidateSummary)
+    _detail_adapter = TypeAdapter(CandidateDetail)
+else:
+    _summaries_adapter = _summary_adapter = _detail_adapter = None
 
 
-@router.get("/candidates", response_model=List[CandidateSummary])
-async def list_candidates():
+@router.get(
+    "/candidates",
+    responses={200: {"model": List[CandidateSummary]}}
+)
+async def list_candidates(
+    skip: int = Query(0, ge=0, description="Number of candidates to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of candidates to return"),
+    mongodb_service: "MongoDBService" = Depends(get_mongodb_service)
+):
     """
-    List all candidates with summary details
+    List one page of candidates with summary details, newest first
     
+    Args:
+        skip: Number of candidates to skip
+        limit: Maximum number of candidates to return
+        mongodb_service: MongoDB service instance (injected)
+        
     Returns:
         List of candidate summaries
     """
     try:
-        candidates = await mongodb_service.list_candidates()
-        
-        summaries = []
-        for candidate in candidates:
-            # Extract name from introduction or use first skill
-            name = None
-            if candidate.get("introduction"):
-                intro = candidate["introduction"]
-                if len(intro) > 0:
-                    # Try to extract name from first sentence
-                    first_sentence = intro.split('.')[0]
-                    if "name is" in first_sentence.lower():
-                        name = first_sentence.split("name is")[-1].strip()
-            
-            # Try to estimate years of experience
-            experience_years = None
-            experience_data = candidate.get("experience", {})
-            if isinstance(experience_data, dict) and "total_years" in experience_data:
-                experience_years = experience_data["total_years"]
-            
-            summary = CandidateSummary(
-                id=str(candidate["_id"]),
-                candidate_id=candidate.get("candidate_id", ""),
-                name=name,
-                skills=candidate.get("skills", [])[:5],  # Top 5 skills
-                experience_years=experience_years,
-                created_at=candidate.get("created_at")
-            )
-            summaries.append(summary)
+        summaries = await mongodb_service.list_candidate_summaries(skip=skip, limit=limit)
+        if _summaries_adapter:
+            _summaries_adapter.validate_python(summaries, strict=True)
         
-        return summaries
+        return ORJSONResponse(summaries)
         
     except Exception as e:
-        logger.error(f"Error listing candidates: {str(e)}")
+        logger.error("Error listing candidates: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to list candidates: {str(e)}")
 
 
-@router.get("/candidate/{candidate_id}", response_model=CandidateDetail)
+@router.get(
+    "/candidates/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}, "description": "One CandidateSummary JSON object per line"}}
+)
+async def stream_candidates(
+    skip: int = Query(0, ge=0, description="Number of candidates to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of candidates to return"),
+    mongodb_service: "MongoDBService" = Depends(get_mongodb_service)
+):
+    """
+    Stream candidate summaries as newline-delimited JSON, newest first
+    
+    Each summary is sent as soon as MongoDB returns it, so larger pages
+    than /candidates allows are served without holding them in memory.
+    An error after streaming has started ends the response early.
+    
+    Args:
+        skip: Number of candidates to skip
+        limit: Maximum number of candidates to return
+        mongodb_service: MongoDB service instance (injected)
+        
+    Returns:
+        Streaming NDJSON response of candidate summaries
+    """
+    async def lines() -> AsyncIterator[bytes]:
+        count = 0
+        try:
+            async for summary in mongodb_service.iter_candidate_summaries(skip=skip, limit=limit):
+                if _summary_adapter:
+                    _summary_adapter.validate_python(summary, strict=True)
+                yield orjson.dumps(summary, option=orjson.OPT_APPEND_NEWLINE)
+                count += 1
+            logger.info("Streamed %d candidate summaries", count)
+        except Exception as e:
+            logger.error("Error streaming candidates after %d summaries: %s", count, e)
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/candidate/{candidate_id}",
+    responses={200: {"model": CandidateDetail}}
+)
 async def get_candidate(
-    candidate_id: str = Path(..., description="Candidate ID from Supabase")
+    candidate_id: str = Path(..., description="Candidate ID from Supabase"),
+    mongodb_service: "MongoDBService" = Depends(get_mongodb_service)
 ):
     """
     Get full information for a single candidate
     
     Args:
         candidate_id: The candidate's unique ID
+        mongodb_service: MongoDB service instance (injected)
         
     Returns:
         Complete candidate details
@@ -79,21 +125,25 @@ async def get_candidate(
         if not candidate:
             raise HTTPException(status_code=404, detail=f"Candidate {candidate_id} not found")
         
-        return CandidateDetail(
-            id=str(candidate["_id"]),
-            candidate_id=candidate.get("candidate_id", ""),
-            education=candidate.get("education", {}),
-            experience=candidate.get("experience", {}),
-            skills=candidate.get("skills", []),
-            hobbies=candidate.get("hobbies", []),
-            certifications=candidate.get("certifications", []),
-            projects=candidate.get("projects", []),
-            introduction=candidate.get("introduction", ""),
-            created_at=candidate.get("created_at")
-        )
+        detail: CandidateDetail = {
+            "id": str(candidate["_id"]),
+            "candidate_id": candidate.get("candidate_id", ""),
+            "education": candidate.get("education", {}),
+            "experience": candidate.get("experience", {}),
+            "skills": candidate.get("skills", []),
+            "hobbies": candidate.get("hobbies", []),
+            "certifications": candidate.get("certifications", []),
+            "projects": candidate.get("projects", []),
+            "introduction": candidate.get("introduction", ""),
+            "created_at": candidate.get("created_at")
+        }
+        if _detail_adapter:
+            _detail_adapter.validate_python(detail, strict=True)
+        
+        return ORJSONResponse(detail)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting candidate {candidate_id}: {str(e)}")
+        logger.error("Error getting candidate %s: %s", candidate_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to get candidate: {str(e)}")
\ No newline at end of file
@@ -3,23 +3,37 @@
 Q&A endpoint for natural language questions about candidates
 """
 from fastapi import APIRouter, HTTPException, Path, Depends, status
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, TYPE_CHECKING
+import contextlib
+import string
+import time
 from app.models.schemas import QuestionRequest, QuestionResponse
-from app.services.mongodb_service import MongoDBService
-from app.services.huggingface_service import HuggingFaceService
 from app.core.logger import get_logger
+from app.core.dependencies import get_mongodb_service, get_hf_service
+
+if TYPE_CHECKING:
+    from app.services.mongodb_service import MongoDBService
+    from app.services.huggingface_service import HuggingFaceService
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Characters allowed in a candidate ID (same set as ^[a-zA-Z0-9_-]+$)
+_CANDIDATE_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 
-def get_mongodb_service() -> MongoDBService:
-    """Dependency for MongoDB service"""
-    return MongoDBService()
-
+# Full tracebacks for unexpected errors are capped per second so an
+# outage doesn't turn into a flood of traceback formatting and log I/O.
+# Holds [tracebacks logged in current window, window start].
+_ERROR_TRACEBACKS_PER_SEC = 10
+_ERR_BUCKET = [0, time.monotonic()]
 
-def get_hf_service() -> HuggingFaceService:
-    """Dependency for HuggingFace service"""
-    return HuggingFaceService()
+# Fields that contain useful information, most commonly populated first
+# (parsed resumes nearly always carry skills and an introduction)
+_USEFUL_FIELDS = (
+    "skills", "introduction", "experience", "education", "projects", "hobbies",
+    "name", "full_name", "summary", "bio", "description"
+)
 
 
 @router.post(
@@ -29,7 +43,7 @@ def get_hf_service() -> HuggingFaceService:
     summary="Ask a question about a candidate",
     responses={
         404: {"description": "Candidate not found"},
-        400: {"description": "Invalid question format"},
+        400: {"description": "Invalid question or candidate ID format"},
         500: {"description": "Internal server error"},
         503: {"description": "LLM service unavailable"}
     }
@@ -40,11 +54,10 @@ async def ask_question(
         ...,
         description="Candidate ID to ask about",
         min_length=1,
-        max_length=100,
-        pattern="^[a-zA-Z0-9_-]+$"
+        max_length=100
     ),
-    mongodb_service: MongoDBService = Depends(get_mongodb_service),
-    hf_service: HuggingFaceService = Depends(get_hf_service)
+    mongodb_service: "MongoDBService" = Depends(get_mongodb_service),
+    hf_service: "HuggingFaceService" = Depends(get_hf_service)
 ) -> QuestionResponse:
     """
     Ask a natural language question about a specific candidate.
@@ -64,37 +77,12 @@ async def ask_question(
     Raises:
         HTTPException: 
             - 404 if candidate not found
-            - 400 if question is invalid
+            - 400 if candidate ID or question is invalid
             - 503 if LLM service is unavailable
             - 500 for other server errors
     """
     try:
-        # Validate question
-        if not request.question or not request.question.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Question cannot be empty"
-            )
-        
-        logger.info(f"Processing question for candidate {candidate_id}: {request.question[:100]}...")
-        
-        # Retrieve candidate data
-        candidate = await mongodb_service.get_candidate(candidate_id)
-        
-        if not candidate:
-            logger.warning(f"Candidate {candidate_id} not found")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Candidate with ID '{candidate_id}' not found"
-            )
-        
-        # Very minimal validation - just check if we have ANY data
-        if not _has_minimal_data(candidate):
-            logger.warning(f"Candidate {candidate_id} has no usable data")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Candidate profile has no available information."
-            )
+        candidate = await _load_candidate(candidate_id, request, mongodb_service)
         
         # Generate answer using LLM
         try:
@@ -103,19 +91,19 @@ async def ask_question(
                 candidate_data=candidate
             )
         except ConnectionError as e:
-            logger.error(f"LLM service connection error: {str(e)}")
+            logger.error("LLM service connection error: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Language model service is currently unavailable. Please try again later."
             )
         except ValueError as e:
-            logger.error(f"Invalid input for LLM: {str(e)}")
+            logger.error("Invalid input for LLM: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid question format: {str(e)}"
             )
         
-        logger.info(f"Successfully answered question for candidate {candidate_id}")
+        logger.info("Successfully answered question for candidate %s", candidate_id)
         
         return QuestionResponse(
             question=request.question.strip(),
@@ -128,19 +116,156 @@ async def ask_question(
         raise
         
     except Exception as e:
-        # Log unexpected errors with full context
+        _log_unexpected_error(candidate_id, request, e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while processing your question"
+        )
+
+
+@router.post(
+    "/ask/{candidate_id}/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Ask a question about a candidate, streaming the answer",
+    responses={
+        200: {"content": {"text/plain": {}}, "description": "Answer text, streamed as it is generated"},
+        404: {"description": "Candidate not found"},
+        400: {"description": "Invalid question or candidate ID format"},
+        500: {"description": "Internal server error"}
+    }
+)
+async def ask_question_stream(
+    request: QuestionRequest,
+    candidate_id: str = Path(
+        ...,
+        description="Candidate ID to ask about",
+        min_length=1,
+        max_length=100
+    ),
+    mongodb_service: "MongoDBService" = Depends(get_mongodb_service),
+    hf_service: "HuggingFaceService" = Depends(get_hf_service)
+) -> StreamingResponse:
+    """
+    Ask a natural language question about a specific candidate and stream
+    the answer as plain text while the LLM generates it.
+    
+    Validation errors are reported with the same status codes as
+    /ask/{candidate_id}; once streaming has started, errors can only end
+    the response early.
+    
+    Args:
+        request: Question request containing the natural language question
+        candidate_id: The candidate's unique identifier
+        mongodb_service: MongoDB service instance (injected)
+        hf_service: HuggingFace service instance (injected)
+        
+    Returns:
+        StreamingResponse: Answer text
+    """
+    try:
+        candidate = await _load_candidate(candidate_id, request, mongodb_service)
+    except HTTPException:
+        raise
+    except Exception as e:
+        _log_unexpected_error(candidate_id, request, e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while processing your question"
+        )
+    
+    async def answer() -> AsyncIterator[str]:
+        # Close the service stream (and its Groq connection) as soon as
+        # this generator is closed, e.g. when the client disconnects
+        pieces = hf_service.answer_question_stream(
+            question=request.question.strip(),
+            candidate_data=candidate
+        )
+        try:
+            async with contextlib.aclosing(pieces):
+                async for piece in pieces:
+                    yield piece
+            logger.info("Successfully streamed answer for candidate %s", candidate_id)
+        except Exception as e:
+            _log_unexpected_error(candidate_id, request, e)
+    
+    return StreamingResponse(answer(), media_type="text/plain")
+
+
+async def _load_candidate(
+    candidate_id: str,
+    request: QuestionRequest,
+    mongodb_service: "MongoDBService"
+) -> dict:
+    """
+    Validate a Q&A request and fetch the candidate it is about
+    
+    Raises:
+        HTTPException: 400 for an invalid candidate ID, empty question or
+            a candidate without usable data; 404 if the candidate is not found
+    """
+    # Validate candidate ID
+    if not _CANDIDATE_ID_CHARS.issuperset(candidate_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Candidate ID may only contain letters, digits, '_' and '-'"
+        )
+    
+    # Validate question
+    if not request.question or not request.question.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Question cannot be empty"
+        )
+    
+    logger.info("Processing question for candidate %s: %.100s...", candidate_id, request.question)
+    
+    # Retrieve candidate data
+    candidate = await mongodb_service.get_candidate(candidate_id)
+    
+    if not candidate:
+        logger.warning("Candidate %s not found", candidate_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Candidate with ID '{candidate_id}' not found"
+        )
+    
+    # Very minimal validation - just check if we have ANY data
+    if not _has_minimal_data(candidate):
+        logger.warning("Candidate %s has no usable data", candidate_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Candidate profile has no available information."
+        )
+    
+    return candidate
+
+
+def _log_unexpected_error(candidate_id: str, request: QuestionRequest, error: Exception):
+    """
+    Log an unexpected Q&A error with full context (tracebacks rate-limited);
+    must be called from the except block handling it
+    """
+    now = time.monotonic()
+    if now - _ERR_BUCKET[1] > 1:
+        _ERR_BUCKET[:] = [0, now]
+    if _ERR_BUCKET[0] < _ERROR_TRACEBACKS_PER_SEC:
         logger.exception(
-            f"Unexpected error answering question for candidate {candidate_id}",
+            "Unexpected error answering question for candidate %s",
+            candidate_id,
             extra={
                 "candidate_id": candidate_id,
                 "question": request.question[:100] if request.question else None,
-                "error_type": type(e).__name__
+                "error_type": type(error).__name__
             }
         )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while processing your question"
+    else:
+        logger.error(
+            "Unexpected error answering question for candidate %s "
+            "(traceback suppressed): %s",
+            candidate_id, type(error).__name__
         )
+    _ERR_BUCKET[0] += 1
 
 
 def _has_minimal_data(candidate: dict) -> bool:
@@ -154,23 +279,15 @@ def _has_minimal_data(candidate: dict) -> bool:
     Returns:
         bool: True if candidate has at least some data
     """
-    # List of all possible fields that contain useful information
-    useful_fields = [
-        "name", "introduction", "full_name",  # Identity
-        "skills", "hobbies",  # Lists
-        "experience", "education", "projects",  # Structured data
-        "summary", "bio", "description"  # Text descriptions
-    ]
-    
-    # Check if ANY field exists and has content
-    for field in useful_fields:
+    for field in _USEFUL_FIELDS:
         value = candidate.get(field)
-        if value:
-            # String check
-            if isinstance(value, str) and value.strip():
-                return True
-            # List or dict check (non-empty)
-            if isinstance(value, (list, dict)) and value:
+        if not value:
+            continue
+        # Whitespace-only strings don't count; any non-empty list/dict does
+        if isinstance(value, str):
+            if value.strip():
                 return True
+        elif isinstance(value, (list, dict)):
+            return True
     
-    return False
\ No newline at end of file
+    return False
@@ -2,24 +2,27 @@
 """
 Upload endpoint for resume files - NOW USING GROQ AI FOR EXTRACTION
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Depends
+from typing import TYPE_CHECKING
 from app.models.schemas import UploadResponse
-from app.services.file_service import FileService
-from app.services.supabase_service import SupabaseService
-from app.services.mongodb_service import MongoDBService
-from app.services.huggingface_service import HuggingFaceService  # CHANGED: Use Groq AI
 from app.core.logger import get_logger
-from datetime import datetime
-import os
+from app.core.dependencies import (
+    get_file_service,
+    get_supabase_service,
+    get_mongodb_service,
+    get_hf_service,
+)
+from datetime import datetime, timezone
+from pathlib import Path
+import asyncio
+
+if TYPE_CHECKING:
+    from app.services.file_service import FileService
+    from app.services.supabase_service import SupabaseService
 
 router = APIRouter()
 logger = get_logger(__name__)
 
-file_service = FileService()
-supabase_service = SupabaseService()
-mongodb_service = MongoDBService()
-groq_service = HuggingFaceService()  # CHANGED: Groq AI service
-
 
 async def process_resume_background(file_path: str, metadata_id: str, filename: str):
     """
@@ -31,41 +34,59 @@ async def process_resume_background(file_path: str, metadata_id: str, filename:
         metadata_id: ID from Supabase metadata
         filename: Original filename
     """
+    mongo_warmup = None
     try:
-        logger.info(f"🚀 Starting GROQ AI processing for {filename}")
+        file_service = get_file_service()
+        groq_service = get_hf_service()
+        mongodb_service = get_mongodb_service()
+        
+        logger.info("🚀 Starting GROQ AI processing for %s", filename)
+        
+        # Warm up the MongoDB connection while text extraction and the
+        # Groq call are in flight (cancelled below if they fail first)
+        mongo_warmup = asyncio.create_task(mongodb_service.ping())
         
         # Extract text from resume
         text = await file_service.extract_text(file_path)
-        logger.info(f"📄 Extracted {len(text)} characters from {filename}")
+        logger.info("📄 Extracted %s characters from %s", len(text), filename)
         
         # Parse resume using GROQ AI (not regex!)
-        logger.info(f"🤖 Sending to Groq AI for intelligent extraction...")
+        logger.info("🤖 Sending to Groq AI for intelligent extraction...")
         parsed_data = await groq_service.extract_resume_info(text)
         
         # Add candidate_id from Supabase
         parsed_data["candidate_id"] = metadata_id
         
-        # Store in MongoDB
-        await mongodb_service.create_candidate(parsed_data)
+        # Rule-based Q&A answers and the LLM context are built once here
+        # instead of per question
+        parsed_data["_context"] = groq_service.precompute_context(parsed_data)
+        parsed_data["_canned"] = groq_service.precompute_canned_answers(parsed_data)
         
-        logger.info(f"✅ Successfully processed and stored candidate {metadata_id} using GROQ AI")
+        # Store in MongoDB and clean up the local file concurrently
+        await mongo_warmup
+        await asyncio.gather(
+            mongodb_service.create_candidate(parsed_data),
+            asyncio.to_thread(Path(file_path).unlink, missing_ok=True)
+        )
         
-        # Clean up local file
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            logger.info(f"🗑️ Cleaned up temporary file: {file_path}")
+        logger.info("✅ Successfully processed and stored candidate %s using GROQ AI", metadata_id)
+        logger.info("🗑️ Cleaned up temporary file: %s", file_path)
             
     except Exception as e:
-        logger.error(f"❌ Error in background processing: {str(e)}")
+        logger.error("❌ Error in background processing: %s", e)
         # Even if AI extraction fails, we still clean up
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        Path(file_path).unlink(missing_ok=True)
+    finally:
+        if mongo_warmup is not None:
+            mongo_warmup.cancel()
 
 
 @router.post("/upload", response_model=UploadResponse)
 async def upload_resume(
     background_tasks: BackgroundTasks,
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    file_service: "FileService" = Depends(get_file_service),
+    supabase_service: "SupabaseService" = Depends(get_supabase_service)
 ):
     """
     Upload a resume file (.pdf or .docx)
@@ -74,6 +95,8 @@ async def upload_resume(
     
     Args:
         file: Resume file to upload
+        file_service: File service instance (injected)
+        supabase_service: Supabase service instance (injected)
         
     Returns:
         UploadResponse with file metadata and candidate ID
@@ -83,18 +106,18 @@ async def upload_resume(
         file_service.validate_file(file)
         
         # Save file locally temporarily
-        file_path = await file_service.save_file(file)
+        file_path, file_size = await file_service.save_file(file)
         
         # Upload to Supabase storage
         storage_path = await supabase_service.upload_file(file, file_path)
         
         # Save metadata to Supabase
-        upload_time = datetime.utcnow()
+        upload_time = datetime.now(timezone.utc)
         metadata = {
             "filename": file.filename,
             "storage_path": storage_path,
             "upload_time": upload_time.isoformat(),
-            "file_size": os.path.getsize(file_path),
+            "file_size": file_size,
             "content_type": file.content_type
         }
         
@@ -108,7 +131,7 @@ async def upload_resume(
             file.filename
         )
         
-        logger.info(f"✅ File uploaded, Groq AI extraction started in background")
+        logger.info("✅ File uploaded, Groq AI extraction started in background")
         
         return UploadResponse(
             message="File uploaded successfully! Groq AI is processing your resume...",
@@ -121,5 +144,5 @@ async def upload_resume(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error uploading file: {str(e)}")
+        logger.error("❌ Error uploading file: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
\ No newline at end of file
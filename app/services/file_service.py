@@ -3,23 +3,28 @@
 File handling service for upload and validation
 """
 from fastapi import UploadFile, HTTPException
-from app.config import settings
+from app.config import get_settings
 from app.utils.text_extractor import TextExtractor
 from app.core.logger import get_logger
 import os
 import aiofiles
 from pathlib import Path
+from typing import Tuple
 
 logger = get_logger(__name__)
 
+# Uploads are copied to disk in chunks of this size
+CHUNK_SIZE = 64 * 1024
+
 
 class FileService:
     """Handles file upload, validation, and text extraction"""
     
     def __init__(self):
+        settings = get_settings()
         self.upload_dir = settings.UPLOAD_DIR
         self.max_file_size = settings.MAX_FILE_SIZE
-        self.allowed_extensions = settings.ALLOWED_EXTENSIONS
+        self.allowed_extensions = frozenset(ext.lower() for ext in settings.ALLOWED_EXTENSIONS)
         self.text_extractor = TextExtractor()
         
         # Create upload directory if it doesn't exist
@@ -36,16 +41,17 @@ class FileService:
             HTTPException: If validation fails
         """
         # Check file extension
-        file_ext = os.path.splitext(file.filename)[1].lower()
+        _, dot, ext = file.filename.rpartition('.')
+        file_ext = '.' + ext.lower() if dot else ''
         if file_ext not in self.allowed_extensions:
             raise HTTPException(
                 status_code=400,
-                detail=f"File type {file_ext} not allowed. Allowed types: {', '.join(self.allowed_extensions)}"
+                detail=f"File type {file_ext} not allowed. Allowed types: {', '.join(sorted(self.allowed_extensions))}"
             )
         
-        logger.info(f"File validation passed for {file.filename}")
+        logger.info("File validation passed for %s", file.filename)
     
-    async def save_file(self, file: UploadFile) -> str:
+    async def save_file(self, file: UploadFile) -> Tuple[str, int]:
         """
         Save uploaded file to local storage
         
@@ -53,31 +59,34 @@ class FileService:
             file: Uploaded file object
             
         Returns:
-            Path to saved file
+            Tuple of (path to saved file, file size in bytes)
         """
+        file_path = os.path.join(self.upload_dir, file.filename)
+        
         try:
-            file_path = os.path.join(self.upload_dir, file.filename)
-            
-            # Save file asynchronously
+            # Stream to disk so at most one chunk per upload is held in memory,
+            # and stop as soon as the size limit is exceeded
+            size = 0
             async with aiofiles.open(file_path, 'wb') as f:
-                content = await file.read()
-                
-                # Check file size
-                if len(content) > self.max_file_size:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"File size exceeds maximum allowed size of {self.max_file_size / (1024*1024)}MB"
-                    )
-                
-                await f.write(content)
+                while chunk := await file.read(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.max_file_size:
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"File size exceeds maximum allowed size of {self.max_file_size / (1024*1024)}MB"
+                        )
+                    
+                    await f.write(chunk)
             
-            logger.info(f"File saved successfully: {file_path}")
-            return file_path
+            logger.info("File saved successfully: %s", file_path)
+            return file_path, size
             
         except HTTPException:
+            Path(file_path).unlink(missing_ok=True)
             raise
         except Exception as e:
-            logger.error(f"Error saving file: {str(e)}")
+            logger.error("Error saving file: %s", e)
+            Path(file_path).unlink(missing_ok=True)
             raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
     
     async def extract_text(self, file_path: str) -> str:
@@ -92,9 +101,9 @@ class FileService:
         """
         try:
             text = await self.text_extractor.extract(file_path)
-            logger.info(f"Text extracted from {file_path}, length: {len(text)}")
+            logger.info("Text extracted from %s, length: %s", file_path, len(text))
             return text
             
         except Exception as e:
-            logger.error(f"Error extracting text from {file_path}: {str(e)}")
+            logger.error("Error extracting text from %s: %s", file_path, e)
             raise
\ No newline at end of file
@@ -2,33 +2,622 @@
 """
 Complete Groq AI integration for resume extraction AND Q&A
 """
-import os
-from huggingface_hub import InferenceClient
-from app.config import settings
+from cachetools import LRUCache, TTLCache
+from huggingface_hub import AsyncInferenceClient, get_async_session, set_async_client_factory
+from huggingface_hub.errors import HfHubHTTPError, InferenceTimeoutError
+from app.config import get_settings
 from app.core.logger import get_logger
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 import asyncio
+import contextlib
+import copy
+import hashlib
 import json
+import httpx
+import orjson
+import random
 import re
 
 logger = get_logger(__name__)
 
+# HTTP statuses worth retrying: rate limiting and transient server errors
+_RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+_RETRY_BASE_DELAY = 0.1  # seconds, doubled per attempt
+_RETRY_MAX_DELAY = 1.0
+# Longest Retry-After the service waits out; beyond it the call fails
+_RETRY_AFTER_MAX = 5.0
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether a failed Groq call is worth retrying"""
+    if isinstance(error, (InferenceTimeoutError, httpx.TransportError)):
+        return True
+    return (
+        isinstance(error, HfHubHTTPError)
+        and error.response is not None
+        and error.response.status_code in _RETRYABLE_STATUSES
+    )
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the server asked to wait before retrying, if it said so"""
+    if not isinstance(error, HfHubHTTPError) or error.response is None:
+        return None
+    try:
+        return max(0.0, float(error.response.headers.get("Retry-After", "")))
+    except ValueError:
+        return None  # missing, or an HTTP date
+
+
+# Characters that matter when scanning for the end of a JSON object; an
+# escape sequence is consumed as a whole so an escaped quote is skipped
+_RE_JSON_TOKEN = re.compile(r'\\.|[{}"]', re.DOTALL)
+
+# A top-level "key": prefix (optionally after the comma that separates fields)
+_RE_FIELD_START = re.compile(r'\s*,?\s*("(?:[^"\\]|\\.)*")\s*:\s*')
+
+# Static extraction instructions. They form the system message so the
+# prompt prefix is byte-identical across calls and Groq's prompt cache
+# can reuse it; only the resume text goes in the user message.
+_EXTRACTION_SYSTEM_MESSAGE = """You are a resume parser that extracts structured data. Always return valid JSON only, no markdown formatting.
+
+Extract structured information from the resume the user sends and return ONLY valid JSON.
+
+Return a JSON object with these fields (use empty string/array if not found):
+{
+    "introduction": "Full Name | Email: email@example.com | Phone: +1234567890",
+    "education": {
+        "degree": "Bachelor of Technology in Computer Science",
+        "institution": "University Name",
+        "field": "Computer Science",
+        "year": "2023"
+    },
+    "experience": {
+        "total_years": "3 years",
+        "companies": "Company A, Company B",
+        "positions": "Software Engineer, Developer"
+    },
+    "skills": ["Python", "JavaScript", "React", "Node.js"],
+    "projects": ["E-commerce Platform", "Chat Application"],
+    "hobbies": ["Reading", "Gaming", "Photography"],
+    "certifications": ["AWS Certified Developer", "Google Cloud Associate"]
+}
+
+CRITICAL: Return ONLY the JSON object, no markdown, no explanation, no extra text."""
+
+
+# Q&A prompt pieces around the per-request context and question. Both Q&A
+# models are served through the chat API, which applies each model's own
+# chat template, so one set of pieces serves every model.
+_QA_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful assistant answering questions about job candidates. Be concise and direct."
+}
+_QA_PROMPT_PREFIX = "Answer this question about a job candidate concisely.\n\nCandidate Information:\n"
+_QA_PROMPT_MIDDLE = "\n\nQuestion: "
+_QA_PROMPT_SUFFIX = (
+    "\n\nProvide a clear, direct answer based only on the information above. "
+    "Keep it brief (1-2 sentences)."
+)
+
+
+# huggingface_hub's own async session settings (request/response hooks,
+# redirects), read once through its public factory before the service
+# registers its pooled one
+_hub_session = get_async_session()
+_HUB_SESSION_SETTINGS = {
+    "event_hooks": _hub_session.event_hooks,
+    "follow_redirects": _hub_session.follow_redirects,
+}
+del _hub_session
+
+
+class _ORJSONAsyncClient(httpx.AsyncClient):
+    """httpx client that encodes json= request bodies with orjson"""
+    
+    def build_request(self, method, url, *, content=None, json=None, headers=None, **kwargs):
+        if json is not None and content is None:
+            try:
+                content = orjson.dumps(json)
+            except TypeError:
+                pass  # not orjson-serializable; let httpx encode it
+            else:
+                json = None
+                headers = httpx.Headers(headers)
+                headers.setdefault("Content-Type", "application/json")
+        return super().build_request(method, url, content=content, json=json, headers=headers, **kwargs)
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """
+    Send requests through a connection pool shared by several clients;
+    closing one of the clients leaves the pool open for the others
+    """
+    
+    def __init__(self, pool: httpx.AsyncBaseTransport):
+        self._pool = pool
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool.handle_async_request(request)
+    
+    async def aclose(self) -> None:
+        pass  # the pool is closed by its owner
+
+
+# Resume prompt budget. Token counts are estimated at ~4 characters per
+# token (no tokenizer for the Groq-hosted model ships with the client).
+_RESUME_TOKEN_BUDGET = 1000
+_CHARS_PER_TOKEN = 4
+_RESUME_HEAD_SHARE = 0.6  # contact details sit at the top, skills often at the bottom
+
+# Extraction output budget: the JSON grows with the resume, so the token
+# limit scales with input length between these bounds
+_EXTRACTION_MIN_TOKENS = 400
+_EXTRACTION_MAX_TOKENS = 1500
+# Resumes up to this many characters go to the fast model
+_FAST_MODEL_MAX_CHARS = 1500
+
+
+def _truncate_resume_text(text: str) -> str:
+    """Fit resume text to the token budget, keeping its head and its tail"""
+    budget = _RESUME_TOKEN_BUDGET * _CHARS_PER_TOKEN
+    if len(text) <= budget:
+        return text
+    head = int(budget * _RESUME_HEAD_SHARE)
+    tail = budget - head
+    return f"{text[:head].rstrip()}\n...\n{text[-tail:].lstrip()}"
+
+
+# Keyword groups for rule-based Q&A. Questions are matched word by word
+# (with the common inflections listed explicitly); multi-word phrases are
+# checked as substrings only when their first word is in the question.
+_RE_WORD = re.compile(r'[a-z]+')
+
+_NAME_WORDS = frozenset({'name', 'names', 'named', 'called'})
+_NAME_PHRASES = ('who is',)
+_SKILLS_WORDS = frozenset({
+    'skills', 'skill', 'skilled', 'technologies', 'technology', 'knows', 'proficient'
+})
+_SKILLS_PHRASES = ('tech stack',)
+_HOBBIES_WORDS = frozenset({'hobbies', 'hobby', 'interests', 'interest', 'interested'})
+_HOBBIES_PHRASES = ('free time', 'likes to do')
+_EDUCATION_WORDS = frozenset({
+    'education', 'educational', 'degree', 'degrees', 'university', 'universities',
+    'college', 'colleges', 'studied', 'graduated'
+})
+_EXPERIENCE_WORDS = frozenset({
+    'experience', 'experienced', 'experiences', 'worked', 'work', 'works', 'working',
+    'job', 'jobs', 'career', 'careers'
+})
+_PROJECTS_WORDS = frozenset({'projects', 'project', 'built', 'developed', 'created'})
+_CERT_WORDS = frozenset({
+    'certification', 'certifications', 'certified', 'certificate', 'certificates'
+})
+_CONTACT_WORDS = frozenset({'email', 'emails', 'contact', 'phone', 'reach', 'reached'})
+
+# Rule-based Q&A categories in priority order: (category, words, phrases).
+# Each category has an answer builder in _ANSWER_BUILDERS.
+_RULE_CATEGORIES = (
+    ("name", _NAME_WORDS, _NAME_PHRASES),
+    ("skills", _SKILLS_WORDS, _SKILLS_PHRASES),
+    ("hobbies", _HOBBIES_WORDS, _HOBBIES_PHRASES),
+    ("education", _EDUCATION_WORDS, ()),
+    ("experience", _EXPERIENCE_WORDS, ()),
+    ("projects", _PROJECTS_WORDS, ()),
+    ("certifications", _CERT_WORDS, ()),
+    ("contact", _CONTACT_WORDS, ()),
+)
+
+
+# Lookup tables built from _RULE_CATEGORIES so a question is classified
+# in one pass over its words; phrases are grouped by their first word
+_CATEGORY_ORDER = tuple(category for category, _, _ in _RULE_CATEGORIES)
+_CATEGORY_RANK = {category: rank for rank, category in enumerate(_CATEGORY_ORDER)}
+_WORD_CATEGORIES = {
+    word: category for category, words, _ in _RULE_CATEGORIES for word in words
+}
+_PHRASE_CATEGORIES: Dict[str, List[Tuple[str, str]]] = {}
+for _category, _, _phrases in _RULE_CATEGORIES:
+    for _phrase in _phrases:
+        _PHRASE_CATEGORIES.setdefault(_phrase.split()[0], []).append((_phrase, _category))
+del _category, _phrases, _phrase
+
+
+def _question_categories(question: str) -> set:
+    """Return the rule-based Q&A categories a (lowercased) question mentions"""
+    words = set(_RE_WORD.findall(question))
+    categories = {_WORD_CATEGORIES[word] for word in words if word in _WORD_CATEGORIES}
+    for word in words & _PHRASE_CATEGORIES.keys():
+        categories.update(
+            category for phrase, category in _PHRASE_CATEGORIES[word] if phrase in question
+        )
+    return categories
+
+
+def _slice_json(text: str) -> Optional[str]:
+    """
+    Return the first complete JSON object in text, or None if there is none.
+    
+    Single left-to-right pass tracking brace depth and whether the scan
+    is inside a string, so braces in string values and any text after the
+    object (even if it contains braces) are handled.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    for match in _RE_JSON_TOKEN.finditer(text, start):
+        token = match.group()
+        if token == '"':
+            in_string = not in_string
+        elif in_string or len(token) == 2:
+            continue
+        elif token == "{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return text[start:match.end()]
+    return None
+
+
+# Shape of the extracted resume structure
+_EDUCATION_FIELDS = ("degree", "institution", "field", "year")
+_EXPERIENCE_FIELDS = ("total_years", "companies", "positions")
+_LIST_FIELDS = ("skills", "projects", "hobbies", "certifications")
+
+# Empty nested records for the fallback structure; never handed out
+# directly, only copied
+_EMPTY_EDUCATION = dict.fromkeys(_EDUCATION_FIELDS, "")
+_EMPTY_EXPERIENCE = dict.fromkeys(_EXPERIENCE_FIELDS, "")
+
+
+def _extract_name(intro: str) -> str:
+    """
+    Extract the name from an introduction like "Anirudh Sharma | Email: ..."
+    
+    Everything before the first "|" if there is one, otherwise everything
+    before "Email:".
+    """
+    separator = "|" if "|" in intro else "Email:"
+    return intro.partition(separator)[0].strip()
+
+
+# (field, format) pairs used to describe education/experience dicts
+_CONTEXT_EDUCATION_PARTS = (
+    ("degree", "{}"), ("institution", "from {}"), ("field", "in {}"), ("year", "({})")
+)
+_ANSWER_EDUCATION_PARTS = (
+    ("degree", "{}"), ("institution", "from {}"), ("year", "in {}")
+)
+_ANSWER_EXPERIENCE_PARTS = (
+    ("total_years", "{} of experience"),
+    ("companies", "at companies including {}"),
+    ("positions", "in roles such as {}")
+)
+
+
+def _describe(data: Dict[str, Any], formats) -> List[str]:
+    """Format the non-empty fields of data with their (field, format) pairs"""
+    return [fmt.format(data[key]) for key, fmt in formats if data.get(key)]
+
+
+# Q&A context formatters: each turns one non-empty candidate field into its
+# context line(s), or None when there is nothing worth including.
+# Extraction stores dicts and lists; other values are included as they are.
+
+def _context_introduction(intro: Any) -> str:
+    return f"Name: {_extract_name(intro)}\nContact: {intro}"
+
+
+def _context_education(edu: Any) -> Optional[str]:
+    if not isinstance(edu, dict):
+        return f"Education: {edu}"
+    edu_parts = _describe(edu, _CONTEXT_EDUCATION_PARTS)
+    return f"Education: {' '.join(edu_parts)}" if edu_parts else None
+
+
+def _context_experience(exp: Any) -> Optional[str]:
+    if not isinstance(exp, dict):
+        return f"Experience: {exp}"
+    exp_parts = [f"{key}: {value}" for key, value in exp.items() if value]
+    return f"Experience: {', '.join(exp_parts)}" if exp_parts else None
+
+
+def _context_list(label: str, limit: int, as_str: bool = False):
+    """Build the formatter for a list field shown as its first limit items"""
+    def fmt(items: Any) -> str:
+        if not isinstance(items, list):
+            return f"{label}: {items}"
+        items = items[:limit]
+        return f"{label}: {', '.join(map(str, items) if as_str else items)}"
+    return fmt
+
+
+def _context_certifications(certs: Any) -> Optional[str]:
+    if isinstance(certs, list):
+        return f"Certifications: {', '.join(certs[:10])}"
+    return None
+
+
+# (field, formatter) in context order
+_CONTEXT_FIELDS = (
+    ("introduction", _context_introduction),
+    ("education", _context_education),
+    ("experience", _context_experience),
+    ("skills", _context_list("Skills", 20)),
+    ("projects", _context_list("Projects", 8, as_str=True)),
+    ("hobbies", _context_list("Hobbies", 15)),
+    ("certifications", _context_certifications),
+)
+
+
+# Rule-based Q&A answer builders: each answers one question category from
+# the candidate data alone, or returns None when it has nothing to say
+
+def _answer_name(candidate_data: Dict[str, Any]) -> Optional[str]:
+    intro = candidate_data.get("introduction", "")
+    if intro:
+        name = _extract_name(intro)
+        if name and len(name) < 50:
+            return f"The candidate's name is {name}."
+    return None
+
+
+def _answer_skills(candidate_data: Dict[str, Any]) -> Optional[str]:
+    skills = candidate_data.get("skills", [])
+    if skills and isinstance(skills, list):
+        if len(skills) <= 5:
+            return f"The candidate's skills include: {', '.join(skills)}."
+        else:
+            return f"The candidate has skills in: {', '.join(skills[:10])}. Plus {len(skills) - 10} more skills."
+    return None
+
+
+def _answer_hobbies(candidate_data: Dict[str, Any]) -> Optional[str]:
+    hobbies = candidate_data.get("hobbies", [])
+    if hobbies and isinstance(hobbies, list):
+        return f"The candidate's hobbies and interests include: {', '.join(hobbies)}."
+    return None
+
+
+def _answer_education(candidate_data: Dict[str, Any]) -> Optional[str]:
+    edu = candidate_data.get("education", {})
+    if edu and isinstance(edu, dict):
+        parts = _describe(edu, _ANSWER_EDUCATION_PARTS)
+        if parts:
+            return f"The candidate's education: {' '.join(parts)}."
+    return None
+
+
+def _answer_experience(candidate_data: Dict[str, Any]) -> Optional[str]:
+    exp = candidate_data.get("experience", {})
+    if exp and isinstance(exp, dict):
+        parts = _describe(exp, _ANSWER_EXPERIENCE_PARTS)
+        if parts:
+            return f"The candidate has {', '.join(parts)}."
+    return None
+
+
+def _answer_projects(candidate_data: Dict[str, Any]) -> Optional[str]:
+    projects = candidate_data.get("projects", [])
+    if projects and isinstance(projects, list):
+        if len(projects) <= 3:
+            return f"The candidate has worked on projects including: {', '.join(projects)}."
+        else:
+            return f"The candidate has worked on {len(projects)} projects including: {', '.join(projects[:5])}."
+    return None
+
+
+def _answer_certifications(candidate_data: Dict[str, Any]) -> Optional[str]:
+    certs = candidate_data.get("certifications", [])
+    if certs and isinstance(certs, list) and certs:
+        return f"The candidate has certifications in: {', '.join(certs)}."
+    else:
+        return "The candidate has no certifications listed."
+
+
+def _answer_contact(candidate_data: Dict[str, Any]) -> Optional[str]:
+    intro = candidate_data.get("introduction", "")
+    if intro:
+        return f"Contact information: {intro}"
+    return None
+
+
+# Category -> answer builder, for dispatch after classification
+_ANSWER_BUILDERS = {
+    "name": _answer_name,
+    "skills": _answer_skills,
+    "hobbies": _answer_hobbies,
+    "education": _answer_education,
+    "experience": _answer_experience,
+    "projects": _answer_projects,
+    "certifications": _answer_certifications,
+    "contact": _answer_contact,
+}
+
+
+class _JSONFieldStream:
+    """
+    Incrementally parse the top-level fields of a JSON object that arrives
+    in chunks. Anything before the opening brace (e.g. a markdown fence)
+    is skipped.
+    """
+    
+    # orjson has no raw_decode, so values are decoded with the stdlib parser
+    _decoder = json.JSONDecoder()
+    
+    def __init__(self):
+        self._buffer = ""
+        self._started = False
+    
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Add a chunk and return the fields it completed"""
+        self._buffer += chunk
+        if not self._started:
+            start = self._buffer.find("{")
+            if start < 0:
+                return []
+            self._buffer = self._buffer[start + 1:]
+            self._started = True
+        
+        fields = []
+        pos = 0
+        while True:
+            match = _RE_FIELD_START.match(self._buffer, pos)
+            if not match:
+                break
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, match.end())
+            except json.JSONDecodeError:
+                break  # value not complete yet
+            if end >= len(self._buffer):
+                break  # a number at the end of the buffer may still grow
+            fields.append((orjson.loads(match.group(1)), value))
+            pos = end
+        
+        self._buffer = self._buffer[pos:]
+        return fields
+
 
 class HuggingFaceService:
     """Handle all AI tasks using FREE Groq provider"""
     
+    # Maximum concurrent Groq requests for batch extraction
+    BATCH_CONCURRENCY = 8
+    
     def __init__(self):
-        # Set up the Hugging Face token
-        os.environ["HF_TOKEN"] = settings.HUGGINGFACE_API_KEY
+        settings = get_settings()
         
-        # Initialize InferenceClient with Groq provider (FREE!)
-        self.client = InferenceClient(
-            provider="groq",
-            api_key=os.environ["HF_TOKEN"]
+        # Initialize async InferenceClient with Groq provider (FREE!)
+        # Calls run directly on the event loop over one pooled HTTP client.
+        # The app is expected to hold a single instance (see
+        # app.core.dependencies.get_hf_service) so the pool stays warm.
+        self._api_key = settings.HUGGINGFACE_API_KEY
+        self._timeout = httpx.Timeout(settings.GROQ_TIMEOUT, connect=settings.GROQ_CONNECT_TIMEOUT)
+        # Explicitly sized keep-alive pool, with HTTP/2 so concurrent Groq
+        # calls share connections. huggingface_hub builds the httpx client of
+        # every inference client through the factory registered here, so the
+        # short-lived stream clients use this pool too.
+        self._pool = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.GROQ_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.GROQ_MAX_KEEPALIVE_CONNECTIONS
+            )
         )
+        set_async_client_factory(self._pooled_async_client)
+        self.client = self._inference_client()
+        self.max_attempts = settings.GROQ_MAX_ATTEMPTS
         
         # Free model available through Groq
         self.model = "openai/gpt-oss-safeguard-20b"
+        # Smaller, faster model used to extract short resumes
+        self.fast_model = "meta-llama/Llama-3.1-8B-Instruct"
+        # Q&A models in order of preference; fallbacks are hedged in when
+        # earlier models fail or are slower than the hedge delay
+        self.qa_models = [self.model, self.fast_model]
+        self.hedge_delay = settings.GROQ_HEDGE_MS / 1000
+        
+        # Exact-match caches of successful Groq responses so repeated
+        # resumes and repeated questions skip the network round-trip
+        self._extraction_cache = LRUCache(maxsize=settings.LLM_CACHE_SIZE)
+        # Answers are keyed on the candidate document's content, so edited
+        # candidates miss naturally; the TTL bounds how long a model answer
+        # is reused for an unchanged one
+        self._answer_cache = TTLCache(maxsize=settings.LLM_CACHE_SIZE, ttl=settings.ANSWER_CACHE_TTL)
+        self._context_cache = LRUCache(maxsize=settings.LLM_CACHE_SIZE)
+        self._inflight_extractions: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+    
+    def _pooled_async_client(self) -> httpx.AsyncClient:
+        """
+        The httpx client huggingface_hub uses for each inference client:
+        over the shared pool, with orjson request bodies
+        """
+        return _ORJSONAsyncClient(transport=_SharedTransport(self._pool), **_HUB_SESSION_SETTINGS)
+    
+    def _inference_client(self) -> AsyncInferenceClient:
+        """A Groq inference client"""
+        return AsyncInferenceClient(
+            provider="groq",
+            api_key=self._api_key,
+            timeout=self._timeout
+        )
+    
+    @contextlib.asynccontextmanager
+    async def _chat_completion_stream(self, **kwargs) -> AsyncIterator[AsyncIterator[Any]]:
+        """
+        Open a streamed Groq chat completion that is closed, and its
+        connection released, when the block exits
+        
+        AsyncInferenceClient only releases the streams it opens when the
+        client itself is closed, so each stream gets its own short-lived
+        client.
+        """
+        client = self._inference_client()
+        try:
+            yield await self._chat_completion(client=client, stream=True, **kwargs)
+        finally:
+            await client.close()
+    
+    async def extract_resume_infos_batch(self, resume_texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract structured information from several resumes concurrently
+        
+        Each resume is sent as its own Groq request; at most
+        BATCH_CONCURRENCY requests are in flight at once.
+        
+        Args:
+            resume_texts: Raw texts extracted from resume files
+            
+        Returns:
+            List of extracted candidate dictionaries, in input order
+        """
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+        
+        async def extract_one(resume_text: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.extract_resume_info(resume_text)
+        
+        return list(await asyncio.gather(*map(extract_one, resume_texts)))
+    
+    async def _chat_completion(
+        self,
+        max_attempts: Optional[int] = None,
+        client: Optional[AsyncInferenceClient] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Create a Groq chat completion, retrying timeouts, rate limits and
+        transient server errors with jittered exponential backoff, or after
+        the server's Retry-After when it sends one
+        
+        For streamed completions only opening the stream is retried.
+        """
+        client = client or self.client
+        max_attempts = max_attempts or self.max_attempts
+        for attempt in range(1, max_attempts + 1):
+            try:
+                return await client.chat.completions.create(**kwargs)
+            except Exception as e:
+                if attempt == max_attempts or not _is_retryable(e):
+                    raise
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt))
+                elif delay > _RETRY_AFTER_MAX:
+                    raise
+                logger.warning(
+                    "⚠️ Groq call failed (%s), retrying in %.2fs (attempt %d/%d)",
+                    type(e).__name__, delay, attempt + 1, max_attempts
+                )
+                await asyncio.sleep(delay)
+    
+    async def close(self):
+        """Close the inference client and its connection pool"""
+        await self.client.close()
+        await self._pool.aclose()
     
     async def extract_resume_info(self, resume_text: str) -> Dict[str, Any]:
         """
@@ -43,71 +632,147 @@ class HuggingFaceService:
         try:
             logger.info(f"🤖 Extracting resume info with Groq AI (text length: {len(resume_text)})")
             
-            # Truncate if too long (to fit in context)
-            if len(resume_text) > 4000:
-                logger.warning(f"⚠️ Resume text too long ({len(resume_text)} chars), truncating to 4000")
-                resume_text = resume_text[:4000]
+            resume_text = self._fit_resume_text(resume_text)
             
-            prompt = f"""Extract structured information from this resume and return ONLY valid JSON.
-
-Resume Text:
-{resume_text}
-
-Return a JSON object with these fields (use empty string/array if not found):
-{{
-    "introduction": "Full Name | Email: email@example.com | Phone: +1234567890",
-    "education": {{
-        "degree": "Bachelor of Technology in Computer Science",
-        "institution": "University Name",
-        "field": "Computer Science",
-        "year": "2023"
-    }},
-    "experience": {{
-        "total_years": "3 years",
-        "companies": "Company A, Company B",
-        "positions": "Software Engineer, Developer"
-    }},
-    "skills": ["Python", "JavaScript", "React", "Node.js"],
-    "projects": ["E-commerce Platform", "Chat Application"],
-    "hobbies": ["Reading", "Gaming", "Photography"],
-    "certifications": ["AWS Certified Developer", "Google Cloud Associate"]
-}}
-
-CRITICAL: Return ONLY the JSON object, no markdown, no explanation, no extra text."""
-
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                self._extract_sync,
-                prompt
-            )
+            cache_key = hashlib.sha256(resume_text.encode()).hexdigest()
+            cached = self._extraction_cache.get(cache_key)
+            if cached is not None:
+                logger.info("✅ Resume info served from cache")
+                # Callers add fields (candidate_id, _id) to the returned dict
+                return copy.deepcopy(cached)
             
-            if result:
-                logger.info(f"✅ Successfully extracted resume info with Groq")
-                logger.info(f"📊 Extracted: {len(result.get('skills', []))} skills, {len(result.get('projects', []))} projects")
-                return result
-            else:
-                logger.warning("⚠️ Groq extraction returned empty, using fallback")
-                return self._get_default_structure()
+            # Identical resumes already being extracted share one Groq call
+            inflight = self._inflight_extractions.get(cache_key)
+            if inflight is not None:
+                logger.info("⏳ Waiting for identical in-flight extraction")
+                return copy.deepcopy(await asyncio.shield(inflight))
+            
+            flight = asyncio.get_running_loop().create_future()
+            self._inflight_extractions[cache_key] = flight
+            try:
+                prompt = self._build_extraction_prompt(resume_text)
+                model, max_tokens = self._extraction_params(resume_text)
+                result = await self._extract_async(prompt, model, max_tokens)
+                
+                if result:
+                    snapshot = copy.deepcopy(result)
+                    self._extraction_cache[cache_key] = snapshot
+                    flight.set_result(snapshot)
+                    logger.info(f"✅ Successfully extracted resume info with Groq")
+                    logger.info(f"📊 Extracted: {len(result.get('skills', []))} skills, {len(result.get('projects', []))} projects")
+                    return result
+                else:
+                    logger.warning("⚠️ Groq extraction returned empty, using fallback")
+                    return self._get_default_structure()
+            finally:
+                del self._inflight_extractions[cache_key]
+                if not flight.done():
+                    flight.set_result(self._get_default_structure())
                 
         except Exception as e:
             logger.error(f"❌ Error extracting resume with Groq: {str(e)}")
             return self._get_default_structure()
     
-    def _extract_sync(self, prompt: str) -> Optional[Dict[str, Any]]:
-        """Synchronous call to Groq for extraction"""
+    def _fit_resume_text(self, resume_text: str) -> str:
+        """Truncate resume text that is too long to fit in context"""
+        if len(resume_text) > _RESUME_TOKEN_BUDGET * _CHARS_PER_TOKEN:
+            logger.warning(
+                f"⚠️ Resume text too long ({len(resume_text)} chars), "
+                f"keeping head and tail within ~{_RESUME_TOKEN_BUDGET} tokens"
+            )
+            resume_text = _truncate_resume_text(resume_text)
+        return resume_text
+    
+    def _extraction_params(self, resume_text: str) -> Tuple[str, int]:
+        """Pick the model and output token limit for (already truncated) resume text"""
+        max_tokens = min(_EXTRACTION_MAX_TOKENS, _EXTRACTION_MIN_TOKENS + len(resume_text) // 4)
+        model = self.fast_model if len(resume_text) <= _FAST_MODEL_MAX_CHARS else self.model
+        return model, max_tokens
+    
+    def _build_extraction_prompt(self, resume_text: str) -> str:
+        """Build the extraction user message for (already truncated) resume text"""
+        return f"Resume Text:\n{resume_text}\n\nReturn the JSON object."
+    
+    async def extract_resume_info_stream(self, resume_text: str) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Extract structured information from resume, yielding each field as
+        soon as Groq has finished generating it
+        
+        Every field of the extraction structure is yielded exactly once;
+        fields the model did not produce are filled in at the end.
+        
+        Args:
+            resume_text: Raw text extracted from resume file
+            
+        Yields:
+            (field name, value) pairs
+        """
+        resume_text = self._fit_resume_text(resume_text)
+        cache_key = hashlib.sha256(resume_text.encode()).hexdigest()
+        cached = self._extraction_cache.get(cache_key)
+        if cached is not None:
+            logger.info("✅ Resume info served from cache")
+            for field, value in copy.deepcopy(cached).items():
+                yield field, value
+            return
+        
+        # Per-field fixes match _validate_and_fix_structure; missing fields
+        # get its defaults, or the fallback structure if the stream fails
+        result = {}
         try:
-            completion = self.client.chat.completions.create(
-                model=self.model,
+            fallback = self._validate_and_fix_structure({})
+            model, max_tokens = self._extraction_params(resume_text)
+            async with self._chat_completion_stream(
+                model=model,
+                messages=[
+                    {"role": "system", "content": _EXTRACTION_SYSTEM_MESSAGE},
+                    {"role": "user", "content": self._build_extraction_prompt(resume_text)}
+                ],
+                temperature=0.1,  # Low temperature for consistent extraction
+                max_tokens=max_tokens
+            ) as stream:
+                parser = _JSONFieldStream()
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    for field, value in parser.feed(chunk.choices[0].delta.content or ""):
+                        if field in fallback and field not in result:
+                            value = self._validate_and_fix_structure({field: value})[field]
+                            result[field] = value
+                            yield field, value
+            
+        except Exception as e:
+            logger.error(f"❌ Groq streaming extraction error: {str(e)}")
+            fallback = self._get_default_structure()
+        
+        complete = len(result) == len(fallback)
+        for field, value in fallback.items():
+            if field not in result:
+                result[field] = value
+                yield field, value
+        
+        if complete:
+            self._extraction_cache[cache_key] = copy.deepcopy(result)
+    
+    async def _extract_async(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = _EXTRACTION_MAX_TOKENS
+    ) -> Optional[Dict[str, Any]]:
+        """Call Groq for extraction (defaults to the main model)"""
+        try:
+            completion = await self._chat_completion(
+                model=model or self.model,
                 messages=[
                     {
                         "role": "system", 
-                        "content": "You are a resume parser that extracts structured data. Always return valid JSON only, no markdown formatting."
+                        "content": _EXTRACTION_SYSTEM_MESSAGE
                     },
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.1,  # Low temperature for consistent extraction
-                max_tokens=1500
+                max_tokens=max_tokens
             )
             
             response_text = completion.choices[0].message.content.strip()
@@ -117,12 +782,12 @@ CRITICAL: Return ONLY the JSON object, no markdown, no explanation, no extra tex
             response_text = self._clean_json_response(response_text)
             
             # Parse JSON
-            parsed = json.loads(response_text)
+            parsed = orjson.loads(response_text)
             
             # Validate structure
             return self._validate_and_fix_structure(parsed)
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"❌ JSON decode error: {str(e)}")
             logger.error(f"Raw response: {response_text[:500]}")
             return None
@@ -132,46 +797,31 @@ CRITICAL: Return ONLY the JSON object, no markdown, no explanation, no extra tex
     
     def _clean_json_response(self, text: str) -> str:
         """Clean JSON response from potential markdown or extra text"""
-        # Remove markdown code blocks
-        text = re.sub(r'^```json\s*', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^```\s*', '', text, flags=re.MULTILINE)
-        text = re.sub(r'\s*```$', '', text, flags=re.MULTILINE)
-        
-        # Find JSON object
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            return json_match.group(0)
-        
-        return text
+        # Keep only the JSON object; markdown fences and any other text
+        # around it are dropped
+        sliced = _slice_json(text)
+        return sliced if sliced is not None else text
     
     def _validate_and_fix_structure(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and fix extracted data structure"""
-        fixed = {
-            "introduction": str(data.get("introduction", "")),
-            "education": data.get("education", {}) if isinstance(data.get("education"), dict) else {},
-            "experience": data.get("experience", {}) if isinstance(data.get("experience"), dict) else {},
-            "skills": data.get("skills", []) if isinstance(data.get("skills"), list) else [],
-            "projects": data.get("projects", []) if isinstance(data.get("projects"), list) else [],
-            "hobbies": data.get("hobbies", []) if isinstance(data.get("hobbies"), list) else [],
-            "certifications": data.get("certifications", []) if isinstance(data.get("certifications"), list) else []
-        }
+        fixed = {"introduction": str(data.get("introduction", ""))}
         
-        # Ensure education has proper structure
-        if fixed["education"]:
-            fixed["education"] = {
-                "degree": str(fixed["education"].get("degree", "")),
-                "institution": str(fixed["education"].get("institution", "")),
-                "field": str(fixed["education"].get("field", "")),
-                "year": str(fixed["education"].get("year", ""))
-            }
-        
-        # Ensure experience has proper structure
-        if fixed["experience"]:
-            fixed["experience"] = {
-                "total_years": str(fixed["experience"].get("total_years", "")),
-                "companies": str(fixed["experience"].get("companies", "")),
-                "positions": str(fixed["experience"].get("positions", ""))
-            }
+        # Education/experience must be dicts; non-empty ones are rebuilt
+        # with exactly the expected string subfields
+        edu = data.get("education")
+        fixed["education"] = (
+            {key: str(edu.get(key, "")) for key in _EDUCATION_FIELDS}
+            if isinstance(edu, dict) and edu else {}
+        )
+        exp = data.get("experience")
+        fixed["experience"] = (
+            {key: str(exp.get(key, "")) for key in _EXPERIENCE_FIELDS}
+            if isinstance(exp, dict) and exp else {}
+        )
+        
+        for key in _LIST_FIELDS:
+            value = data.get(key)
+            fixed[key] = value if isinstance(value, list) else []
         
         return fixed
     
@@ -186,26 +836,21 @@ CRITICAL: Return ONLY the JSON object, no markdown, no explanation, no extra tex
         
         # SECOND: Try Groq LLM if rule-based failed
         try:
-            context = self._prepare_context(candidate_data)
+            candidate_key, context = self._get_context(candidate_data)
+            
+            cache_key = (candidate_key, " ".join(question.lower().split()))
+            cached = self._answer_cache.get(cache_key)
+            if cached is not None:
+                logger.info("✅ Answer served from cache")
+                return cached
+            
             logger.info(f"🔍 Context prepared, asking Groq...")
             
-            prompt = f"""Answer this question about a job candidate concisely.
-
-Candidate Information:
-{context}
-
-Question: {question}
-
-Provide a clear, direct answer based only on the information above. Keep it brief (1-2 sentences)."""
-
-            loop = asyncio.get_event_loop()
-            answer = await loop.run_in_executor(
-                None,
-                self._ask_groq_sync,
-                prompt
-            )
+            prompt = self._build_qa_prompt(context, question)
+            answer = await self._ask_hedged(prompt)
             
-            if answer and len(answer) > 5:
+            if answer:
+                self._answer_cache[cache_key] = answer
                 logger.info(f"✅ Groq answered: {answer[:100]}")
                 return answer
                 
@@ -219,15 +864,140 @@ Provide a clear, direct answer based only on the information above. Keep it brie
         
         return "Unable to generate answer. Please try rephrasing your question."
     
-    def _ask_groq_sync(self, prompt: str) -> Optional[str]:
-        """Synchronous question answering via Groq"""
+    async def answer_question_stream(self, question: str, candidate_data: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Answer a question about a candidate, yielding the LLM answer as it
+        is generated
+        
+        Rule-based and cached answers are yielded whole. Generated text is
+        held back until it is long enough to be a usable answer; if the
+        stream fails or ends before that, the answer from answer_question
+        (hedged models, then the loose rule fallback) is yielded instead.
+        
+        Args:
+            question: The user's question
+            candidate_data: Candidate information
+            
+        Yields:
+            Pieces of the answer text
+        """
+        rule_based_answer = self._try_rule_based_answer(question, candidate_data)
+        if rule_based_answer:
+            logger.info(f"✅ Answered with rule-based logic: {rule_based_answer[:100]}")
+            yield rule_based_answer
+            return
+        
+        pieces = []
+        streaming = False
         try:
-            completion = self.client.chat.completions.create(
+            candidate_key, context = self._get_context(candidate_data)
+            
+            cache_key = (candidate_key, " ".join(question.lower().split()))
+            cached = self._answer_cache.get(cache_key)
+            if cached is not None:
+                logger.info("✅ Answer served from cache")
+                yield cached
+                return
+            
+            logger.info("🔍 Context prepared, streaming from Groq...")
+            
+            async with self._chat_completion_stream(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant answering questions about job candidates. Be concise and direct."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._qa_messages(self._build_qa_prompt(context, question)),
+                temperature=0.3,
+                max_tokens=200
+            ) as stream:
+                async for chunk in stream:
+                    if not chunk.choices or not chunk.choices[0].delta.content:
+                        continue
+                    pieces.append(chunk.choices[0].delta.content)
+                    if streaming:
+                        yield pieces[-1]
+                    elif len("".join(pieces).strip()) > 5:
+                        streaming = True
+                        yield "".join(pieces).lstrip()
+            
+            if streaming:
+                answer = "".join(pieces).strip()
+                self._answer_cache[cache_key] = answer
+                logger.info(f"✅ Groq answered: {answer[:100]}")
+                return
+            
+        except Exception as e:
+            logger.error(f"❌ Error with Groq QA stream: {str(e)}")
+            if streaming:
+                return  # part of the answer has been sent already
+        
+        yield await self.answer_question(question, candidate_data)
+    
+    def _build_qa_prompt(self, context: str, question: str) -> str:
+        """Build the Q&A prompt for a candidate context and a question"""
+        return f"{_QA_PROMPT_PREFIX}{context}{_QA_PROMPT_MIDDLE}{question}{_QA_PROMPT_SUFFIX}"
+    
+    def _qa_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Chat messages for a Q&A prompt"""
+        return [_QA_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+    
+    async def _ask_hedged(self, prompt: str) -> Optional[str]:
+        """
+        Ask the Q&A models with hedging and return the first usable answer
+        
+        The primary model is asked first; each fallback is started once
+        every model already running has failed or hedge_delay has passed
+        without an answer. Every model but the last is asked only once, so
+        a timeout, rate limit or overload cascades straight to the next
+        model instead of being retried. Requests still running when an
+        answer arrives are cancelled.
+        """
+        tasks = set()
+        last = len(self.qa_models) - 1
+        try:
+            for i, model in enumerate(self.qa_models):
+                max_attempts = None if i == last else 1
+                tasks.add(asyncio.create_task(self._ask_groq_async(prompt, model, max_attempts)))
+                answer = await self._first_usable_answer(tasks, self.hedge_delay)
+                if answer:
+                    return answer
+            return await self._first_usable_answer(tasks, None)
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _first_usable_answer(self, tasks: set, timeout: Optional[float]) -> Optional[str]:
+        """
+        Wait for the running Q&A tasks until one returns a usable answer
+        
+        Finished tasks are removed from the set. Returns None when all of
+        them failed or the timeout passed first.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while tasks:
+            remaining = None if deadline is None else max(0, deadline - loop.time())
+            done, _ = await asyncio.wait(tasks, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                return None
+            for task in done:
+                tasks.discard(task)
+                answer = task.result()
+                if answer and len(answer) > 5:
+                    return answer
+                if answer is not None:
+                    logger.warning(f"⚠️ Groq QA returned an unusable answer: {answer!r}")
+        return None
+    
+    async def _ask_groq_async(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_attempts: Optional[int] = None
+    ) -> Optional[str]:
+        """Question answering via Groq (defaults to the main model and max_attempts)"""
+        try:
+            completion = await self._chat_completion(
+                max_attempts=max_attempts,
+                model=model or self.model,
+                messages=self._qa_messages(prompt),
                 temperature=0.3,
                 max_tokens=200
             )
@@ -238,6 +1008,46 @@ Provide a clear, direct answer based only on the information above. Keep it brie
             logger.error(f"❌ Groq QA error: {str(e)}")
             return None
     
+    def precompute_canned_answers(self, candidate_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Build the rule-based answer for every question category up front
+        
+        Stored on the candidate record as "_canned" at parse time so Q&A
+        only has to detect the category and look the answer up. Categories
+        without an answer are left out.
+        
+        Args:
+            candidate_data: Extracted candidate information
+            
+        Returns:
+            Dictionary mapping category to answer
+        """
+        canned = {}
+        for category in _CATEGORY_ORDER:
+            try:
+                answer = _ANSWER_BUILDERS[category](candidate_data)
+            except TypeError:
+                # e.g. non-string list items; leave it to the LLM
+                continue
+            if answer:
+                canned[category] = answer
+        return canned
+    
+    def precompute_context(self, candidate_data: Dict[str, Any]) -> str:
+        """
+        Build the Q&A context for a candidate up front
+        
+        Stored on the candidate record as "_context" at parse time so Q&A
+        does not rebuild it for every question, including after a restart.
+        
+        Args:
+            candidate_data: Extracted candidate information
+            
+        Returns:
+            Context string
+        """
+        return self._prepare_context(candidate_data)
+    
     def _try_rule_based_answer(self, question: str, candidate_data: Dict[str, Any], strict: bool = True) -> Optional[str]:
         """
         Try to answer simple questions with rule-based logic
@@ -251,191 +1061,87 @@ Provide a clear, direct answer based only on the information above. Keep it brie
             Answer string or None if can't answer with rules
         """
         q_lower = question.lower().strip()
+        categories = _question_categories(q_lower)
+        if not categories:
+            return None
         
-        # NAME questions
-        name_keywords = ['name', 'called', 'who is', 'candidate name', 'their name']
-        if strict:
-            is_name_question = any(keyword in q_lower for keyword in name_keywords) and len(q_lower) < 30
-        else:
-            is_name_question = any(keyword in q_lower for keyword in name_keywords)
-        
-        if is_name_question:
-            intro = candidate_data.get("introduction", "")
-            if intro:
-                # Extract name from "Anirudh Sharma | Email: ..."
-                name = intro.split("|")[0].strip() if "|" in intro else intro.split("Email:")[0].strip()
-                if name and len(name) < 50:
-                    return f"The candidate's name is {name}."
-        
-        # SKILLS questions
-        skills_keywords = ['skills', 'skill', 'technologies', 'tech stack', 'knows', 'proficient']
-        if any(keyword in q_lower for keyword in skills_keywords):
-            skills = candidate_data.get("skills", [])
-            if skills and isinstance(skills, list):
-                if len(skills) <= 5:
-                    return f"The candidate's skills include: {', '.join(skills)}."
-                else:
-                    return f"The candidate has skills in: {', '.join(skills[:10])}. Plus {len(skills) - 10} more skills."
-        
-        # HOBBIES questions
-        hobbies_keywords = ['hobbies', 'hobby', 'interests', 'interest', 'free time', 'likes to do']
-        if any(keyword in q_lower for keyword in hobbies_keywords):
-            hobbies = candidate_data.get("hobbies", [])
-            if hobbies and isinstance(hobbies, list):
-                return f"The candidate's hobbies and interests include: {', '.join(hobbies)}."
-        
-        # EDUCATION questions
-        education_keywords = ['education', 'degree', 'university', 'college', 'studied', 'graduated']
-        if any(keyword in q_lower for keyword in education_keywords):
-            edu = candidate_data.get("education", {})
-            if edu and isinstance(edu, dict):
-                parts = []
-                if edu.get("degree"):
-                    parts.append(edu["degree"])
-                if edu.get("institution"):
-                    parts.append(f"from {edu['institution']}")
-                if edu.get("year"):
-                    parts.append(f"in {edu['year']}")
-                
-                if parts:
-                    return f"The candidate's education: {' '.join(parts)}."
-        
-        # EXPERIENCE questions
-        experience_keywords = ['experience', 'worked', 'work', 'job', 'career', 'years of experience']
-        if any(keyword in q_lower for keyword in experience_keywords):
-            exp = candidate_data.get("experience", {})
-            if exp and isinstance(exp, dict):
-                parts = []
-                if exp.get("total_years"):
-                    parts.append(f"{exp['total_years']} of experience")
-                if exp.get("companies"):
-                    parts.append(f"at companies including {exp['companies']}")
-                if exp.get("positions"):
-                    parts.append(f"in roles such as {exp['positions']}")
-                
-                if parts:
-                    return f"The candidate has {', '.join(parts)}."
-        
-        # PROJECTS questions
-        projects_keywords = ['projects', 'project', 'built', 'developed', 'created']
-        if any(keyword in q_lower for keyword in projects_keywords):
-            projects = candidate_data.get("projects", [])
-            if projects and isinstance(projects, list):
-                if len(projects) <= 3:
-                    return f"The candidate has worked on projects including: {', '.join(projects)}."
-                else:
-                    return f"The candidate has worked on {len(projects)} projects including: {', '.join(projects[:5])}."
-        
-        # CERTIFICATIONS questions
-        cert_keywords = ['certification', 'certified', 'certificate']
-        if any(keyword in q_lower for keyword in cert_keywords):
-            certs = candidate_data.get("certifications", [])
-            if certs and isinstance(certs, list) and certs:
-                return f"The candidate has certifications in: {', '.join(certs)}."
-            else:
-                return "The candidate has no certifications listed."
-        
-        # EMAIL/CONTACT questions
-        contact_keywords = ['email', 'contact', 'phone', 'reach']
-        if any(keyword in q_lower for keyword in contact_keywords):
-            intro = candidate_data.get("introduction", "")
-            if intro:
-                return f"Contact information: {intro}"
-        
-        return None
-    
-    def _prepare_context(self, candidate_data: Dict[str, Any]) -> str:
-        """Format candidate data for context"""
-        parts = []
+        # Strict mode only trusts name matches in short questions
+        if strict and len(q_lower) >= 30:
+            categories.discard("name")
         
-        # Extract NAME from introduction
-        if candidate_data.get("introduction"):
-            intro = candidate_data["introduction"]
-            name = intro.split("|")[0].strip() if "|" in intro else intro.split("Email:")[0].strip()
-            parts.append(f"Name: {name}")
-            parts.append(f"Contact: {intro}")
-        
-        # Education
-        if candidate_data.get("education"):
-            edu = candidate_data["education"]
-            if isinstance(edu, dict):
-                edu_parts = []
-                if edu.get("degree"):
-                    edu_parts.append(edu["degree"])
-                if edu.get("institution"):
-                    edu_parts.append(f"from {edu['institution']}")
-                if edu.get("field"):
-                    edu_parts.append(f"in {edu['field']}")
-                if edu.get("year"):
-                    edu_parts.append(f"({edu['year']})")
-                
-                if edu_parts:
-                    parts.append(f"Education: {' '.join(edu_parts)}")
-            else:
-                parts.append(f"Education: {edu}")
-        
-        # Experience
-        if candidate_data.get("experience"):
-            exp = candidate_data["experience"]
-            if isinstance(exp, dict):
-                exp_parts = []
-                for key, value in exp.items():
-                    if value:
-                        exp_parts.append(f"{key}: {value}")
-                if exp_parts:
-                    parts.append(f"Experience: {', '.join(exp_parts)}")
-            else:
-                parts.append(f"Experience: {exp}")
+        # Records parsed before canned answers existed are answered live
+        canned = candidate_data.get("_canned")
+        if not isinstance(canned, dict):
+            canned = None
         
-        # Skills
-        if candidate_data.get("skills"):
-            skills = candidate_data["skills"]
-            if isinstance(skills, list):
-                parts.append(f"Skills: {', '.join(skills[:20])}")
+        # Matched categories are tried in priority order (usually there is
+        # just one); the first one that has an answer wins
+        for category in sorted(categories, key=_CATEGORY_RANK.__getitem__):
+            if canned is not None:
+                answer = canned.get(category)
             else:
-                parts.append(f"Skills: {skills}")
+                answer = _ANSWER_BUILDERS[category](candidate_data)
+            if answer:
+                return answer
         
-        # Projects
-        if candidate_data.get("projects"):
-            projects = candidate_data["projects"]
-            if isinstance(projects, list):
-                parts.append(f"Projects: {', '.join(str(p) for p in projects[:8])}")
-            else:
-                parts.append(f"Projects: {projects}")
+        return None
+    
+    def _get_context(self, candidate_data: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Return a content key for the candidate data and its prepared context,
+        using the "_context" stored on the record when present and otherwise
+        reusing the context built for an identical candidate document
         
-        # Hobbies
-        if candidate_data.get("hobbies"):
-            hobbies = candidate_data["hobbies"]
-            if isinstance(hobbies, list):
-                parts.append(f"Hobbies: {', '.join(hobbies[:15])}")
-            else:
-                parts.append(f"Hobbies: {hobbies}")
+        Args:
+            candidate_data: Candidate information
+            
+        Returns:
+            (candidate key, context string)
+        """
+        context = candidate_data.get("_context")
+        if isinstance(context, str):
+            # Precomputed at parse time; answers depend only on the context
+            return hashlib.blake2b(context.encode(), digest_size=16).hexdigest(), context
         
-        # Certifications
-        if candidate_data.get("certifications"):
-            certs = candidate_data["certifications"]
-            if isinstance(certs, list) and certs:
-                parts.append(f"Certifications: {', '.join(certs[:10])}")
+        try:
+            canonical = orjson.dumps(candidate_data, default=str, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # Not serializable (e.g. non-string keys): key on the context itself
+            context = self._prepare_context(candidate_data)
+            return hashlib.blake2b(context.encode(), digest_size=16).hexdigest(), context
         
+        key = hashlib.blake2b(canonical, digest_size=16).hexdigest()
+        context = self._context_cache.get(key)
+        if context is None:
+            context = self._context_cache[key] = self._prepare_context(candidate_data)
+        return key, context
+    
+    def _prepare_context(self, candidate_data: Dict[str, Any]) -> str:
+        """Format candidate data for context"""
+        parts = []
+        for field, fmt in _CONTEXT_FIELDS:
+            value = candidate_data.get(field)
+            if value:
+                line = fmt(value)
+                if line:
+                    parts.append(line)
         return "\n".join(parts)
     
     def _get_default_structure(self) -> Dict[str, Any]:
-        """Return default empty structure if extraction fails"""
+        """
+        Return default empty structure if extraction fails
+        
+        Built from shallow copies of module-level templates: callers add
+        fields to the result, so every call needs its own containers, but
+        copying two flat dicts is cheaper than building or deep-copying
+        the whole structure.
+        """
         return {
             "introduction": "",
-            "education": {
-                "degree": "",
-                "institution": "",
-                "field": "",
-                "year": ""
-            },
-            "experience": {
-                "total_years": "",
-                "companies": "",
-                "positions": ""
-            },
+            "education": _EMPTY_EDUCATION.copy(),
+            "experience": _EMPTY_EXPERIENCE.copy(),
             "skills": [],
             "projects": [],
             "hobbies": [],
             "certifications": []
-        }
\ No newline at end of file
+        }
@@ -3,22 +3,110 @@
 MongoDB integration for candidate data storage
 """
 from motor.motor_asyncio import AsyncIOMotorClient
-from app.config import settings
+from pymongo import DESCENDING
+from bson.raw_bson import RawBSONDocument
+from app.config import get_settings
 from app.core.logger import get_logger
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-from bson import ObjectId
+from typing import AsyncIterator, List, Dict, Any, Mapping, Optional
+from datetime import datetime, timezone
 
 logger = get_logger(__name__)
 
+# "... name is X." within the first sentence of the introduction
+_NAME_PATTERN = r"^[^.]*?\bname\s+is\s+([^.\n]{1,80})"
+
+# Server-side shape of a candidate summary: only the fields the list view
+# needs leave MongoDB, and the name is pulled out of the introduction
+# by the server (requires MongoDB 4.2+).
+_SUMMARY_PROJECTION = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "candidate_id": {"$ifNull": ["$candidate_id", ""]},
+    "name": {
+        "$let": {
+            "vars": {
+                "match": {
+                    "$regexFind": {
+                        "input": "$introduction",
+                        "regex": _NAME_PATTERN,
+                        "options": "i"
+                    }
+                }
+            },
+            "in": {
+                "$cond": [
+                    "$$match",
+                    {"$trim": {"input": {"$arrayElemAt": ["$$match.captures", 0]}}},
+                    None
+                ]
+            }
+        }
+    },
+    "skills": {
+        "$cond": [{"$isArray": "$skills"}, {"$slice": ["$skills", 5]}, []]
+    },
+    "experience_years": {"$ifNull": ["$experience.total_years", None]},
+    "created_at": {"$ifNull": ["$created_at", None]}
+}
+
+# Fields returned by list_candidates when the caller does not pick any
+_LIST_FIELDS = ("candidate_id", "introduction", "created_at")
+
+# Q&A data precomputed from the other fields at parse time
+_DERIVED_FIELDS = ("_context", "_canned")
+
 
 class MongoDBService:
     """Handle MongoDB operations for candidate data"""
     
     def __init__(self):
+        settings = get_settings()
         self.client = AsyncIOMotorClient(settings.MONGODB_URL)
         self.db = self.client[settings.MONGODB_DB_NAME]
         self.collection = self.db[settings.MONGODB_COLLECTION_NAME]
+        # Same collection, returning undecoded BSON that is only parsed when
+        # a field is read (for list views that touch a few fields)
+        self.raw_collection = self.collection.with_options(
+            codec_options=self.collection.codec_options.with_options(document_class=RawBSONDocument)
+        )
+    
+    def close(self):
+        """Close the client and its connection pool"""
+        self.client.close()
+    
+    async def ensure_indexes(self) -> bool:
+        """
+        Create the indexes candidate queries rely on (no-op if they exist):
+        a unique index on candidate_id for lookups/updates/deletes and a
+        descending index on created_at for the newest-first listings
+        
+        Returns:
+            True if the indexes are in place, False otherwise
+        """
+        try:
+            await self.collection.create_index("candidate_id", unique=True)
+            await self.collection.create_index([("created_at", DESCENDING)])
+            logger.info("MongoDB indexes ensured")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Could not ensure MongoDB indexes: {str(e)}")
+            return False
+    
+    async def ping(self) -> bool:
+        """
+        Round-trip to the server to open a pooled connection ahead of use
+        
+        Returns:
+            True if the server responded, False otherwise
+        """
+        try:
+            await self.client.admin.command("ping")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"MongoDB ping failed: {str(e)}")
+            return False
     
     async def create_candidate(self, candidate_data: Dict[str, Any]) -> str:
         """
@@ -32,7 +120,7 @@ class MongoDBService:
         """
         try:
             # Add created_at timestamp
-            candidate_data["created_at"] = datetime.utcnow()
+            candidate_data["created_at"] = datetime.now(timezone.utc)
             
             # Insert into MongoDB
             result = await self.collection.insert_one(candidate_data)
@@ -44,6 +132,34 @@ class MongoDBService:
             logger.error(f"Error creating candidate in MongoDB: {str(e)}")
             raise
     
+    async def create_candidates(self, candidates: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several candidate records in one round trip
+        
+        Args:
+            candidates: Dictionaries containing candidate information
+            
+        Returns:
+            MongoDB document IDs, in input order
+        """
+        if not candidates:
+            return []
+        
+        try:
+            created_at = datetime.now(timezone.utc)
+            for candidate_data in candidates:
+                candidate_data["created_at"] = created_at
+            
+            # Unordered: one failing document does not stop the rest
+            result = await self.collection.insert_many(candidates, ordered=False)
+            
+            logger.info(f"Created {len(result.inserted_ids)} candidates")
+            return [str(inserted_id) for inserted_id in result.inserted_ids]
+            
+        except Exception as e:
+            logger.error(f"Error creating candidates in MongoDB: {str(e)}")
+            raise
+    
     async def get_candidate(self, candidate_id: str) -> Optional[Dict[str, Any]]:
         """
         Get candidate by candidate_id (from Supabase)
@@ -62,16 +178,76 @@ class MongoDBService:
             logger.error(f"Error getting candidate from MongoDB: {str(e)}")
             return None
     
-    async def list_candidates(self) -> List[Dict[str, Any]]:
+    async def get_candidates(self, candidate_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get several candidates by candidate_id in one query
+        
+        Args:
+            candidate_ids: Candidate IDs from Supabase metadata
+            
+        Returns:
+            Candidate documents found (in no particular order)
+        """
+        if not candidate_ids:
+            return []
+        
+        try:
+            cursor = self.collection.find({"candidate_id": {"$in": candidate_ids}})
+            return [doc async for doc in cursor]
+            
+        except Exception as e:
+            logger.error(f"Error getting candidates from MongoDB: {str(e)}")
+            return []
+    
+    async def iter_candidates(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        fields: Optional[List[str]] = None
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """
+        Iterate over one page of candidates, newest first, as MongoDB
+        returns them (errors are raised to the caller)
+        
+        Args:
+            skip: Number of candidates to skip
+            limit: Maximum number of candidates to yield
+            fields: Fields to return (defaults to _LIST_FIELDS)
+            
+        Yields:
+            Read-only candidate documents holding only the requested
+            fields, decoded lazily on first access
+        """
+        projection = dict.fromkeys(fields or _LIST_FIELDS, 1)
+        cursor = (
+            self.raw_collection.find({}, projection)
+            .sort("created_at", -1)
+            .skip(skip)
+            .limit(limit)
+        )
+        async for doc in cursor:
+            yield doc
+    
+    async def list_candidates(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        fields: Optional[List[str]] = None
+    ) -> List[Mapping[str, Any]]:
         """
-        List all candidates
+        List one page of candidates, newest first
         
+        Args:
+            skip: Number of candidates to skip
+            limit: Maximum number of candidates to return
+            fields: Fields to return (defaults to _LIST_FIELDS)
+            
         Returns:
-            List of candidate documents
+            List of read-only candidate documents holding only the requested
+            fields, decoded lazily on first access
         """
         try:
-            cursor = self.collection.find({}).sort("created_at", -1)
-            candidates = await cursor.to_list(length=100)
+            candidates = [doc async for doc in self.iter_candidates(skip, limit, fields)]
             
             logger.info(f"Retrieved {len(candidates)} candidates")
             return candidates
@@ -80,10 +256,88 @@ class MongoDBService:
             logger.error(f"Error listing candidates from MongoDB: {str(e)}")
             return []
     
+    async def iter_candidate_summaries(self, skip: int = 0, limit: int = 20) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over one page of candidate summaries, shaped by MongoDB, as
+        they arrive (errors are raised to the caller)
+        
+        Args:
+            skip: Number of candidates to skip
+            limit: Maximum number of summaries to yield
+            
+        Yields:
+            Summary documents (id, candidate_id, name, top 5 skills,
+            experience_years, created_at)
+        """
+        pipeline = [
+            {"$sort": {"created_at": -1}},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": _SUMMARY_PROJECTION}
+        ]
+        async for summary in self.collection.aggregate(pipeline):
+            yield summary
+    
+    async def list_candidate_summaries(self, skip: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        List one page of candidate summaries, shaped by MongoDB
+        
+        Args:
+            skip: Number of candidates to skip
+            limit: Maximum number of summaries to return
+            
+        Returns:
+            List of summary documents (id, candidate_id, name, top 5 skills,
+            experience_years, created_at)
+        """
+        try:
+            summaries = [summary async for summary in self.iter_candidate_summaries(skip, limit)]
+            
+            logger.info(f"Retrieved {len(summaries)} candidate summaries")
+            return summaries
+            
+        except Exception as e:
+            logger.error(f"Error listing candidate summaries from MongoDB: {str(e)}")
+            return []
+    
+    async def get_candidates_summary(self, candidate_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the summaries of several candidates in one aggregation
+        
+        Args:
+            candidate_ids: Candidate IDs from Supabase metadata
+            
+        Returns:
+            Dictionary mapping candidate_id to its summary document (same
+            shape as list_candidate_summaries); unknown IDs are left out
+        """
+        if not candidate_ids:
+            return {}
+        
+        try:
+            pipeline = [
+                {"$match": {"candidate_id": {"$in": candidate_ids}}},
+                {"$project": _SUMMARY_PROJECTION}
+            ]
+            summaries = {
+                summary["candidate_id"]: summary
+                async for summary in self.collection.aggregate(pipeline)
+            }
+            
+            logger.info(f"Retrieved {len(summaries)} candidate summaries by ID")
+            return summaries
+            
+        except Exception as e:
+            logger.error(f"Error getting candidate summaries from MongoDB: {str(e)}")
+            return {}
+    
     async def update_candidate(self, candidate_id: str, update_data: Dict[str, Any]) -> bool:
         """
         Update candidate information
         
+        Precomputed Q&A fields not included in the update are dropped so
+        they are never served stale.
+        
         Args:
             candidate_id: Candidate ID from Supabase
             update_data: Dictionary with fields to update
@@ -92,9 +346,13 @@ class MongoDBService:
             True if successful, False otherwise
         """
         try:
+            update = {"$set": update_data}
+            stale = {field: "" for field in _DERIVED_FIELDS if field not in update_data}
+            if stale:
+                update["$unset"] = stale
             result = await self.collection.update_one(
                 {"candidate_id": candidate_id},
-                {"$set": update_data}
+                update
             )
             
             return result.modified_count > 0
@@ -3,31 +3,313 @@
 Robust resume parsing with proper regex extraction
 """
 from app.core.logger import get_logger
+from cachetools import LRUCache
+from itertools import islice
+import asyncio
+import copy
+import hashlib
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick  # optional (pyahocorasick): faster keyword scans
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # optional (google-re2): linear-time matching
+except ImportError:
+    re2 = None
 
 logger = get_logger(__name__)
 
+# Patterns are compiled once at import instead of on every parse
+
+# Python's \s (every str.isspace() character) spelled out for RE2, whose
+# \s is ASCII-only
+_RE2_SPACE = r'\t\n\x0b\f\r\x1c-\x1f\x{85}\p{Z}'
+
+
+def _re2_source(pattern: str) -> str:
+    """Rewrite a Python regex for RE2, keeping the meaning of \\s"""
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i:i + 2]
+            if escape == r'\s':
+                escape = _RE2_SPACE if in_class else f'[{_RE2_SPACE}]'
+            out.append(escape)
+            i += 2
+            continue
+        if char == '[' and not in_class:
+            in_class = True
+        elif char == ']' and in_class:
+            in_class = False
+        out.append(char)
+        i += 1
+    return ''.join(out)
+
+
+# Characters RE2 and re case-fold differently
+_RE_RE2_FOLD_MISMATCH = re.compile('[\u0130\u0131]')
+
+
+class _LinearPattern:
+    """
+    Case-insensitive pattern matched with RE2 when google-re2 is installed
+    
+    For patterns whose backtracking cost grows with the square of the text
+    length (a lazy or greedy run that has to be rescanned from every start
+    position); RE2 matches in linear time. RE2 folds case like Python
+    except for the Turkish dotted/dotless i (U+0130/U+0131), so text
+    containing either, and text RE2 cannot encode (lone surrogates), is
+    matched with re.
+    """
+    
+    def __init__(self, pattern: str):
+        self._re = re.compile(pattern, re.IGNORECASE)
+        self._re2 = re2.compile('(?i)' + _re2_source(pattern)) if re2 is not None else None
+    
+    def findall(self, text: str) -> list:
+        if self._re2 is not None and (text.isascii() or not _RE_RE2_FOLD_MISMATCH.search(text)):
+            try:
+                return self._re2.findall(text)
+            except UnicodeEncodeError:
+                pass
+        return self._re.findall(text)
+
+
+def _section_patterns(*keywords: str) -> Tuple[re.Pattern, ...]:
+    """
+    Section-header patterns for _find_section, one per keyword in priority
+    order (the first keyword with a header wins, not the first header)
+    """
+    return tuple(
+        re.compile(rf'\b{keyword}s?\b[\s:]*\n(.+?)(?:\n\n|\n[A-Z]{{3,}}|\Z)', re.DOTALL)
+        for keyword in keywords
+    )
+
+
+# Contact info
+_RE_EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_RE_EMAIL_P_PREFIX = re.compile(r'^p(thereal)', re.IGNORECASE)
+_RE_EMAIL_SHORT_PREFIX = re.compile(r'^[a-z]{1,3}(thereal)', re.IGNORECASE)
+_RE_PHONE = re.compile(r'[\+\(]?[1-9][0-9 \-\(\)]{8,}[0-9]')
+
+# Education
+_EDUCATION_SECTION = _section_patterns('education', 'academic', 'qualification')
+_DEGREE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(Bachelor[^\n]{5,80})',
+    r'(Master[^\n]{5,80})',
+    r'(B\.?Tech[^\n]{5,80})',
+    r'(M\.?Tech[^\n]{5,80})',
+    r'(MBA[^\n]{5,80})',
+    r'(PhD[^\n]{5,80})',
+    r'(B\.?E\.?[^\n]{5,80})',
+    r'(M\.?E\.?[^\n]{5,80})',
+))
+_RE_INSTITUTION = re.compile(r'\b([A-Z][A-Za-z\s&]+(?:University|Institute|College|School)[A-Za-z\s&]*)')
+_RE_YEAR = re.compile(r'\b(19|20)\d{2}\b')
+# (field, lowercased field) in priority order
+_EDUCATION_FIELDS = tuple((field, field.lower()) for field in (
+    'Computer Engineering', 'Computer Science', 'Software Engineering', 'Information Technology',
+    'Electronics', 'Mechanical', 'Civil', 'Business', 'Data Science', 'Engineering'
+))
+
+# Experience
+_EXPERIENCE_SECTION = _section_patterns('experience', 'employment', 'work')
+_RE_YEARS_OF_EXPERIENCE = re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)', re.IGNORECASE)
+_RE_COMPANY = re.compile(r'(?:at|@)\s+([A-Z][A-Za-z0-9\s&.,]+?)(?:\s*[\n,|]|\s+as\s+)')
+_RE_POSITION = re.compile(
+    r'\b(Senior|Junior|Lead|Principal)?\s*(Software|Full[- ]?Stack|Backend|Frontend|Data|ML|AI|Cloud|DevOps)?\s*(Engineer|Developer|Architect|Analyst|Scientist|Manager|Consultant)\b',
+    re.IGNORECASE
+)
+
+
+# The non-ASCII characters that case-insensitive regexes match to ASCII
+# letters, mapped so that lowercasing turns them into those letters
+_ASCII_CASE_FOLD = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+
+class _KeywordScanner:
+    """
+    Find which keywords occur in a text as whole words (case-insensitive)
+    in one pass instead of one search per keyword
+    
+    With pyahocorasick installed the pass is an Aho-Corasick automaton
+    over the lowercased text, and each keyword it finds is confirmed with
+    its whole-word regex; otherwise it is one combined regex.
+    """
+    
+    def __init__(self, keywords):
+        keywords = tuple(keywords)
+        self._word_patterns = {
+            keyword: re.compile(rf'\b{re.escape(keyword)}\b', re.IGNORECASE) for keyword in keywords
+        }
+        
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                self._automaton.add_word(keyword.lower(), keyword)
+            self._automaton.make_automaton()
+            return
+        self._automaton = None
+        
+        # A keyword that can match where a longer keyword starting with it
+        # also matches ("C" in "C++11") would be hidden by it in a single
+        # pass, so such keywords are searched for on their own
+        shadowed = {
+            keyword for keyword in keywords for other in keywords
+            if other != keyword and re.match(rf'{re.escape(keyword)}\b', other, re.IGNORECASE)
+        }
+        self._keywords = tuple(keyword for keyword in keywords if keyword not in shadowed)
+        alternatives = '|'.join(f'({re.escape(keyword)})' for keyword in self._keywords)
+        # Zero-width, so a match never hides a keyword overlapping it
+        self._pattern = re.compile(rf'(?=\b(?:{alternatives})\b)', re.IGNORECASE)
+        self._separate = tuple(keyword for keyword in keywords if keyword in shadowed)
+    
+    def find(self, text: str) -> Set[str]:
+        """Return the keywords found in text"""
+        if self._automaton is not None:
+            folded = text.translate(_ASCII_CASE_FOLD).lower()
+            candidates = {keyword for _, keyword in self._automaton.iter(folded)}
+            return {keyword for keyword in candidates if self._word_patterns[keyword].search(text)}
+        
+        found = {self._keywords[match.lastindex - 1] for match in self._pattern.finditer(text)}
+        found.update(keyword for keyword in self._separate if self._word_patterns[keyword].search(text))
+        return found
+
+
+# Skills matched as whole words: programming languages, frameworks,
+# databases, cloud & tools. Each is listed under the name it is reported
+# as; _KeywordScanner escapes it for matching, so no per-match cleanup
+_SKILL_SCANNER = _KeywordScanner([
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Rust', 'Ruby', 'PHP', 'Swift', 'Kotlin', 'Scala', 'R', 'C',
+    'React', 'Angular', 'Vue', 'Next.js', 'Node.js', 'Django', 'Flask', 'FastAPI', 'Spring', 'Express', 'Laravel', 'Rails', 'Streamlit',
+    'MongoDB', 'PostgreSQL', 'MySQL', 'Redis', 'Elasticsearch', 'Cassandra', 'DynamoDB', 'Oracle', 'SQL', 'SQLite', 'MariaDB',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'Git', 'GitHub', 'GitLab', 'CI/CD', 'Terraform', 'Ansible', 'Linux', 'Nginx', 'Apache'
+])
+# Skills matched as case-insensitive substrings: AI/ML and other tech,
+# as (skill, lowercased skill)
+_SUBSTRING_SKILLS = tuple((skill, skill.lower()) for skill in (
+    'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'NLP', 'Computer Vision', 'Data Science', 'Scikit-learn', 'Keras', 'OpenCV', 'Pandas', 'NumPy',
+    'REST API', 'GraphQL', 'Microservices', 'Agile', 'Scrum', 'DevOps', 'MLOps', 'DataOps'
+))
+
+# Certifications
+_CERTIFICATION_SECTION = _section_patterns('certification', 'certificate', 'license', 'credential')
+_CERT_HEADER_PREFIXES = ('certification', 'certificate', 'license')
+_RE_BULLET_PREFIX = re.compile(r'^[•\-\*\d\.\)]+\s*')
+_CERT_PATTERNS = tuple(_LinearPattern(pattern) for pattern in (
+    r'(AWS Certified[A-Za-z\s\-]*?)(?:\n|,|\||$)',
+    r'(Azure[A-Za-z\s\-]*?Certified[A-Za-z\s\-]*?)(?:\n|,|\||$)',
+    r'(Google Cloud[A-Za-z\s\-]*?)(?:\n|,|\||$)',
+    r'(Certified[A-Za-z\s\-]*?)(?:\n|,|\||$)',
+    r'([A-Z][A-Za-z\s]*Certificate[A-Za-z\s]*?)(?:\n|,|\||$)',
+))
+# "Certified X" or "X Certified" for common certification vendors
+_CERT_KEYWORD_PATTERNS = tuple(
+    re.compile(rf'(?:Certified\s+{keyword}|{keyword}\s+Certified)[A-Za-z\s\-]*', re.IGNORECASE)
+    for keyword in ('AWS', 'Azure', 'Google Cloud', 'GCP', 'PMP', 'CISSP', 'CompTIA',
+                    'Kubernetes', 'Oracle', 'Salesforce', 'Cisco', 'ITIL', 'Scrum')
+)
+
+# Projects
+_PROJECT_SECTION = _section_patterns('project', 'portfolio')
+_RE_PROJECT_TITLE = _LinearPattern(r'([^\n•\-]{10,}?)(?:\||GitHub)')
+_RE_PROJECT_CHUNK_SPLIT = re.compile(r'\n\s*\n|^[•\-\*]\s*', re.MULTILINE)
+_RE_BUILT_PROJECT = re.compile(r'(?:Built|Developed|Created|Implemented)\s+([^.]{20,100}?)(?:\.|using|with)', re.IGNORECASE)
+
+# Hobbies
+_HOBBY_SECTION = _section_patterns('hobbies', 'interests', 'personal', 'activities')
+_HOBBY_HEADER_WORDS = ('hobbies', 'interests', 'activities', 'personal')
+_PROFESSIONAL_WORDS = ('project', 'developed', 'built', 'worked')
+_RE_HOBBY_SPLIT = re.compile(r'[,•\-\n|]')
+_RE_LEADING_NUMBERING = re.compile(r'^[\d\.\s]+')
+_COMMON_HOBBIES = (
+    'Reading', 'Writing', 'Gaming', 'Music', 'Sports', 'Travel', 'Traveling', 'Photography',
+    'Cooking', 'Fitness', 'Yoga', 'Meditation', 'Art', 'Drawing', 'Painting',
+    'Blogging', 'Volunteering', 'Dancing', 'Singing', 'Guitar', 'Piano',
+    'Running', 'Cycling', 'Swimming', 'Hiking', 'Chess', 'Cricket', 'Football',
+    'Basketball', 'Tennis', 'Badminton', 'Movies', 'Films', 'TV Shows',
+    'Anime', 'Manga', 'Video Games', 'Board Games', 'Gardening', 'Baking',
+    'AI/ML Research', 'Automation', 'Backend Development', 'Open Source'
+)
+_HOBBY_SCANNER = _KeywordScanner(_COMMON_HOBBIES)
+_HOBBY_MENTION_PATTERNS = {
+    hobby: re.compile(re.escape(hobby), re.IGNORECASE) for hobby in _COMMON_HOBBIES
+}
+_HOBBY_CONTEXT_WIDTH = 50
+
+
+def _mention_context(text: str, mention: re.Pattern, width: int) -> Optional[str]:
+    """
+    The first match of .{0,width}MENTION.{0,width} in text, found from the
+    mention's positions instead of by running the wider regex
+    """
+    first = mention.search(text)
+    if first is None:
+        return None
+    
+    # '.' stops at newlines, so the match stays on the first mention's line
+    line_start = text.rfind('\n', 0, first.start()) + 1
+    line_end = text.find('\n', first.end())
+    if line_end < 0:
+        line_end = len(text)
+    
+    # The leftmost match starts up to width chars before the first mention;
+    # its greedy prefix then reaches the last mention starting within width
+    # chars of there, followed by up to width chars
+    start = max(first.start() - width, line_start)
+    last = first
+    while (match := mention.search(text, last.start() + 1, line_end)) and match.start() <= start + width:
+        last = match
+    return text[start:min(last.end() + width, line_end)]
+
+
+# Parsed resumes kept per parser, keyed by a digest of the text
+_PARSE_CACHE_SIZE = 256
+
 
 class ResumeParser:
     """Parse resume text with reliable rule-based extraction"""
     
     def __init__(self):
-        pass
+        # Parsing is a pure function of the text, so re-parses of the same
+        # resume (retries, re-ranking) are served from here
+        self._parse_cache = LRUCache(maxsize=_PARSE_CACHE_SIZE)
     
     async def parse_resume(self, text: str) -> Dict[str, Any]:
         """Parse resume - no BS, just results"""
+        cache_key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        result = self._parse_cache.get(cache_key)
+        if result is None:
+            # The regex scans are CPU-bound, so they run in a worker thread
+            result = await asyncio.to_thread(self._parse_resume_sync, text)
+            self._parse_cache[cache_key] = result
+        else:
+            logger.info("✅ Resume parse served from cache")
+        # Callers may add fields to the returned dict
+        return copy.deepcopy(result)
+    
+    def _parse_resume_sync(self, text: str) -> Dict[str, Any]:
+        """Synchronous body of parse_resume"""
         try:
             logger.info("📄 Starting resume parsing")
             
+            # Lowercased once for every section lookup and keyword test
+            text_lower = text.lower()
             result = {
                 "introduction": self._extract_contact_info(text),
-                "education": self._extract_education(text),
-                "experience": self._extract_experience(text),
-                "skills": self._extract_skills(text),
-                "certifications": self._extract_certifications(text),
-                "projects": self._extract_projects(text),
-                "hobbies": self._extract_hobbies(text)
+                "education": self._extract_education(text, text_lower),
+                "experience": self._extract_experience(text, text_lower),
+                "skills": self._extract_skills(text, text_lower),
+                "certifications": self._extract_certifications(text, text_lower),
+                "projects": self._extract_projects(text, text_lower),
+                "hobbies": self._extract_hobbies(text, text_lower)
             }
             
             logger.info(f"✅ Extracted: {len(result['skills'])} skills, {len(result['projects'])} projects, {len(result['certifications'])} certs, {len(result['hobbies'])} hobbies")
@@ -49,16 +331,16 @@ class ResumeParser:
                 break
         
         # Email - WITH CORRUPTION FIXES
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+        email_match = _RE_EMAIL.search(text)
         if email_match:
             email = email_match.group()
             
             # FIX CORRUPTED EMAILS
             # Fix 1: "petherealX" -> "therealX"
-            email = re.sub(r'^p(thereal)', r'\1', email, flags=re.IGNORECASE)
+            email = _RE_EMAIL_P_PREFIX.sub(r'\1', email)
             
             # Fix 2: Other common prefixes before "thereal"
-            email = re.sub(r'^[a-z]{1,3}(thereal)', r'\1', email, flags=re.IGNORECASE)
+            email = _RE_EMAIL_SHORT_PREFIX.sub(r'\1', email)
             
             # Fix 3: "Xp@" -> "X@"
             email = email.replace('p@', '@')
@@ -66,7 +348,7 @@ class ResumeParser:
             parts.append(f"Email: {email}")
         
         # Phone
-        phone = re.search(r'[\+\(]?[1-9][0-9 \-\(\)]{8,}[0-9]', text)
+        phone = _RE_PHONE.search(text)
         if phone:
             parts.append(f"Phone: {phone.group().strip()}")
         
@@ -74,38 +356,28 @@ class ResumeParser:
         logger.info(f"📧 Extracted contact: {result}")
         return result
     
-    def _extract_education(self, text: str) -> Dict[str, str]:
+    def _extract_education(self, text: str, text_lower: Optional[str] = None) -> Dict[str, str]:
         """Extract education details"""
         edu = {}
         
         # Find education section
-        edu_section = self._find_section(text, ['education', 'academic', 'qualification'])
+        edu_section = self._find_section(text, _EDUCATION_SECTION, text_lower)
         search_text = edu_section if edu_section else text[:2000]  # Focus on top part
         
         # Degree - get more context
-        degree_patterns = [
-            r'(Bachelor[^\n]{5,80})',
-            r'(Master[^\n]{5,80})',
-            r'(B\.?Tech[^\n]{5,80})',
-            r'(M\.?Tech[^\n]{5,80})',
-            r'(MBA[^\n]{5,80})',
-            r'(PhD[^\n]{5,80})',
-            r'(B\.?E\.?[^\n]{5,80})',
-            r'(M\.?E\.?[^\n]{5,80})',
-        ]
-        for pattern in degree_patterns:
-            matches = re.findall(pattern, search_text, re.IGNORECASE)
-            if matches:
-                edu['degree'] = matches[0].strip()
+        for pattern in _DEGREE_PATTERNS:
+            match = pattern.search(search_text)
+            if match:
+                edu['degree'] = match.group(1).strip()
                 break
         
         # Institution
-        institutions = re.findall(r'\b([A-Z][A-Za-z\s&]+(?:University|Institute|College|School)[A-Za-z\s&]*)', search_text)
-        if institutions:
-            edu['institution'] = institutions[0].strip()
+        institution = _RE_INSTITUTION.search(search_text)
+        if institution:
+            edu['institution'] = institution.group(1).strip()
         
         # Year - all 4 digit years
-        years = re.findall(r'\b(19|20)\d{2}\b', search_text)
+        years = _RE_YEAR.findall(search_text)
         if years:
             # If multiple years, assume last is graduation
             edu['year'] = years[-1]
@@ -113,139 +385,98 @@ class ResumeParser:
                 edu['duration'] = f"{years[0]} - {years[-1]}"
         
         # Field - more specific
-        fields = ['Computer Engineering', 'Computer Science', 'Software Engineering', 'Information Technology', 
-                 'Electronics', 'Mechanical', 'Civil', 'Business', 'Data Science', 'Engineering']
-        for field in fields:
-            if field.lower() in search_text.lower():
+        search_lower = search_text.lower()
+        for field, field_lower in _EDUCATION_FIELDS:
+            if field_lower in search_lower:
                 edu['field'] = field
                 break
         
         return edu
     
-    def _extract_experience(self, text: str) -> Dict[str, str]:
+    def _extract_experience(self, text: str, text_lower: Optional[str] = None) -> Dict[str, str]:
         """Extract work experience"""
         exp = {}
         
-        exp_section = self._find_section(text, ['experience', 'employment', 'work'])
+        exp_section = self._find_section(text, _EXPERIENCE_SECTION, text_lower)
         search_text = exp_section if exp_section else text
         
         # Years of experience
-        years = re.findall(r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)', search_text, re.IGNORECASE)
+        years = _RE_YEARS_OF_EXPERIENCE.search(search_text)
         if years:
-            exp['total_years'] = f"{years[0]} years"
+            exp['total_years'] = f"{years.group(1)} years"
         
-        # Companies
-        companies = re.findall(r'(?:at|@)\s+([A-Z][A-Za-z0-9\s&.,]+?)(?:\s*[\n,|]|\s+as\s+)', search_text)
+        # Companies - only the first 3 mentions are used, so stop there
+        companies = {match.group(1).strip() for match in islice(_RE_COMPANY.finditer(search_text), 3)}
         if companies:
-            exp['companies'] = ", ".join(set([c.strip() for c in companies[:3]]))
+            exp['companies'] = ", ".join(companies)
         
-        # Positions
-        positions = re.findall(r'\b(Senior|Junior|Lead|Principal)?\s*(Software|Full[- ]?Stack|Backend|Frontend|Data|ML|AI|Cloud|DevOps)?\s*(Engineer|Developer|Architect|Analyst|Scientist|Manager|Consultant)\b', search_text, re.IGNORECASE)
-        if positions:
-            titles = [" ".join([p for p in pos if p]).strip() for pos in positions[:3]]
+        # Positions - only the first 3 mentions are used, so stop there
+        titles = [
+            " ".join(filter(None, match.groups()))
+            for match in islice(_RE_POSITION.finditer(search_text), 3)
+        ]
+        if titles:
             exp['positions'] = ", ".join(set(titles))
         
         return exp
     
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract technical skills"""
-        skills = set()
-        
-        # Programming languages
-        langs = ['Python', 'Java', 'JavaScript', 'TypeScript', 'C\\+\\+', 'C#', 'Go', 'Rust', 'Ruby', 'PHP', 'Swift', 'Kotlin', 'Scala', 'R', 'C']
-        for lang in langs:
-            if re.search(rf'\b{lang}\b', text, re.IGNORECASE):
-                skills.add(lang.replace('\\', ''))
-        
-        # Frameworks
-        frameworks = ['React', 'Angular', 'Vue', 'Next\\.js', 'Node\\.js', 'Django', 'Flask', 'FastAPI', 'Spring', 'Express', 'Laravel', 'Rails', 'Streamlit']
-        for fw in frameworks:
-            if re.search(rf'\b{fw}\b', text, re.IGNORECASE):
-                skills.add(fw.replace('\\', ''))
-        
-        # Databases
-        dbs = ['MongoDB', 'PostgreSQL', 'MySQL', 'Redis', 'Elasticsearch', 'Cassandra', 'DynamoDB', 'Oracle', 'SQL', 'SQLite', 'MariaDB']
-        for db in dbs:
-            if re.search(rf'\b{db}\b', text, re.IGNORECASE):
-                skills.add(db)
-        
-        # Cloud & Tools
-        tools = ['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'Git', 'GitHub', 'GitLab', 'CI/CD', 'Terraform', 'Ansible', 'Linux', 'Nginx', 'Apache']
-        for tool in tools:
-            if re.search(rf'\b{tool}\b', text, re.IGNORECASE):
-                skills.add(tool)
-        
-        # AI/ML
-        ml = ['Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'NLP', 'Computer Vision', 'Data Science', 'Scikit-learn', 'Keras', 'OpenCV', 'Pandas', 'NumPy']
-        for m in ml:
-            if m.lower() in text.lower():
-                skills.add(m)
-        
-        # Other tech
-        other = ['REST API', 'GraphQL', 'Microservices', 'Agile', 'Scrum', 'DevOps', 'MLOps', 'DataOps']
-        for tech in other:
-            if tech.lower() in text.lower():
-                skills.add(tech)
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # Programming languages, frameworks, databases, cloud & tools
+        skills = _SKILL_SCANNER.find(text)
+        
+        # AI/ML and other tech
+        skills.update(skill for skill, skill_lower in _SUBSTRING_SKILLS if skill_lower in text_lower)
         
         return sorted(list(skills))
     
-    def _extract_certifications(self, text: str) -> List[str]:
+    def _extract_certifications(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract certifications - SUPER AGGRESSIVE"""
         certs = set()
         
         # Find certification section
-        cert_section = self._find_section(text, ['certification', 'certificate', 'license', 'credential'])
+        cert_section = self._find_section(text, _CERTIFICATION_SECTION, text_lower)
         
         if cert_section:
             # Extract lines from cert section
             lines = [l.strip() for l in cert_section.split('\n') if l.strip()]
             for line in lines:
                 # Skip section headers
-                if len(line) < 150 and not any(line.lower().startswith(h) for h in ['certification', 'certificate', 'license']):
+                if len(line) < 150 and not line.lower().startswith(_CERT_HEADER_PREFIXES):
                     # Remove bullets and numbering
-                    line = re.sub(r'^[•\-\*\d\.\)]+\s*', '', line)
+                    line = _RE_BULLET_PREFIX.sub('', line)
                     if len(line) > 8:
                         certs.add(line)
         
         # Look for certification patterns anywhere
-        cert_patterns = [
-            r'(AWS Certified[A-Za-z\s\-]*?)(?:\n|,|\||$)',
-            r'(Azure[A-Za-z\s\-]*?Certified[A-Za-z\s\-]*?)(?:\n|,|\||$)',
-            r'(Google Cloud[A-Za-z\s\-]*?)(?:\n|,|\||$)',
-            r'(Certified[A-Za-z\s\-]*?)(?:\n|,|\||$)',
-            r'([A-Z][A-Za-z\s]*Certificate[A-Za-z\s]*?)(?:\n|,|\||$)',
-        ]
-        
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _CERT_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 clean = match.strip()
                 if 8 < len(clean) < 100:
                     certs.add(clean)
         
         # Common certifications - if found, extract context
-        cert_keywords = ['AWS', 'Azure', 'Google Cloud', 'GCP', 'PMP', 'CISSP', 'CompTIA', 
-                        'Kubernetes', 'Oracle', 'Salesforce', 'Cisco', 'ITIL', 'Scrum']
-        
-        for keyword in cert_keywords:
-            # Look for "Certified X" or "X Certified"
-            pattern = rf'(?:Certified\s+{keyword}|{keyword}\s+Certified)[A-Za-z\s\-]*'
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _CERT_KEYWORD_PATTERNS:
+            matches = pattern.findall(text)
             certs.update([m.strip() for m in matches if len(m.strip()) > 5])
         
         return sorted(list(certs))[:15]
     
-    def _extract_projects(self, text: str) -> List[str]:
+    def _extract_projects(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract projects - group them properly"""
         projects = []
         
         # Find projects section
-        proj_section = self._find_section(text, ['project', 'portfolio'])
+        proj_section = self._find_section(text, _PROJECT_SECTION, text_lower)
         
         if proj_section:
             # Look for project titles (usually have GitHub link or bold formatting)
             # Pattern: Project Name | Technologies
-            project_titles = re.findall(r'([^\n•\-]{10,}?)(?:\||GitHub)', proj_section, re.IGNORECASE)
+            project_titles = _RE_PROJECT_TITLE.findall(proj_section)
             
             if project_titles:
                 # Get unique project titles
@@ -255,70 +486,59 @@ class ResumeParser:
                         projects.append(clean_title)
             else:
                 # Fallback: split by double newline or bullets
-                chunks = re.split(r'\n\s*\n|^[•\-\*]\s*', proj_section, flags=re.MULTILINE)
+                chunks = _RE_PROJECT_CHUNK_SPLIT.split(proj_section)
                 for chunk in chunks:
                     # Get first line as project name
                     first_line = chunk.split('\n')[0].strip()
                     if 10 < len(first_line) < 150 and not first_line.lower().startswith('project'):
                         projects.append(first_line)
+            
+            if projects:
+                return projects[:10]
         
         # If still no projects, look for "Built/Developed" patterns
-        if not projects:
-            patterns = [
-                r'(?:Built|Developed|Created|Implemented)\s+([^.]{20,100}?)(?:\.|using|with)',
-            ]
-            for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                projects.extend([m.strip() for m in matches[:5]])
-        
-        return projects[:10]
+        return [m.strip() for m in _RE_BUILT_PROJECT.findall(text)[:5]]
     
-    def _extract_hobbies(self, text: str) -> List[str]:
+    def _extract_hobbies(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract hobbies and interests - SUPER AGGRESSIVE"""
         hobbies = set()
         
         # Find hobbies section
-        hobby_section = self._find_section(text, ['hobbies', 'interests', 'personal', 'activities'])
+        hobby_section = self._find_section(text, _HOBBY_SECTION, text_lower)
         
         if hobby_section:
             # Split by common separators
-            items = re.split(r'[,•\-\n|]', hobby_section)
+            items = _RE_HOBBY_SPLIT.split(hobby_section)
             for item in items:
-                item = re.sub(r'^[\d\.\s]+', '', item).strip()  # Remove numbering
+                item = _RE_LEADING_NUMBERING.sub('', item).strip()  # Remove numbering
                 # Hobbies are short phrases
-                if 3 < len(item) < 60 and not any(keyword in item.lower() for keyword in ['hobbies', 'interests', 'activities', 'personal']):
+                item_lower = item.lower()
+                if 3 < len(item) < 60 and not any(keyword in item_lower for keyword in _HOBBY_HEADER_WORDS):
                     hobbies.add(item)
+            
+            if hobbies:
+                return sorted(hobbies)[:15]
         
         # If no hobbies found, check common hobbies anywhere in text
-        if not hobbies:
-            common_hobbies = [
-                'Reading', 'Writing', 'Gaming', 'Music', 'Sports', 'Travel', 'Traveling', 'Photography', 
-                'Cooking', 'Fitness', 'Yoga', 'Meditation', 'Art', 'Drawing', 'Painting',
-                'Blogging', 'Volunteering', 'Dancing', 'Singing', 'Guitar', 'Piano',
-                'Running', 'Cycling', 'Swimming', 'Hiking', 'Chess', 'Cricket', 'Football',
-                'Basketball', 'Tennis', 'Badminton', 'Movies', 'Films', 'TV Shows',
-                'Anime', 'Manga', 'Video Games', 'Board Games', 'Gardening', 'Baking',
-                'AI/ML Research', 'Automation', 'Backend Development', 'Open Source'
-            ]
-            
-            for hobby in common_hobbies:
-                # Only add if it appears in a personal/hobby context
-                if re.search(rf'\b{hobby}\b', text, re.IGNORECASE):
-                    # Check it's not in a professional context
-                    context = re.search(rf'.{{0,50}}{hobby}.{{0,50}}', text, re.IGNORECASE)
-                    if context and not any(word in context.group().lower() for word in ['project', 'developed', 'built', 'worked']):
-                        hobbies.add(hobby)
-        
-        return sorted(list(hobbies))[:15]
+        for hobby in _HOBBY_SCANNER.find(text):
+            # Only add if it appears in a personal/hobby context,
+            # not a professional one
+            context = _mention_context(text, _HOBBY_MENTION_PATTERNS[hobby], _HOBBY_CONTEXT_WIDTH)
+            if context is not None:
+                context_lower = context.lower()
+                if not any(word in context_lower for word in _PROFESSIONAL_WORDS):
+                    hobbies.add(hobby)
+        
+        return sorted(hobbies)[:15]
     
-    def _find_section(self, text: str, keywords: List[str]) -> str:
-        """Find a section in text by keywords"""
-        text_lower = text.lower()
+    def _find_section(self, text: str, patterns: Tuple[re.Pattern, ...], text_lower: Optional[str] = None) -> str:
+        """Find a section in text by its header patterns (text_lower: text.lower(), if already computed)"""
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for keyword in keywords:
+        for pattern in patterns:
             # Look for section header
-            pattern = rf'\b{keyword}s?\b[\s:]*\n(.+?)(?:\n\n|\n[A-Z]{{3,}}|\Z)'
-            match = re.search(pattern, text_lower, re.DOTALL)
+            match = pattern.search(text_lower)
             if match:
                 # Get original text with proper casing
                 start = match.start(1)
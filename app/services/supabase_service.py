@@ -2,38 +2,88 @@
 """
 Supabase integration for file storage and metadata
 """
-from supabase import create_client, Client
+from postgrest import AsyncPostgrestClient
+from storage3 import AsyncStorageClient
 from fastapi import UploadFile, HTTPException
-from app.config import settings
+from app.config import get_settings
 from app.core.logger import get_logger
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import List
+import asyncio
+import httpx
 import uuid
 
 logger = get_logger(__name__)
 
 
+class _PooledPostgrestClient(AsyncPostgrestClient):
+    """AsyncPostgrestClient whose session sends through a shared transport"""
+    
+    def __init__(self, base_url: str, transport: httpx.AsyncHTTPTransport, **kwargs):
+        self._transport = transport
+        super().__init__(base_url, **kwargs)
+    
+    def create_session(self, base_url, headers, timeout) -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=base_url, headers=headers, timeout=timeout, transport=self._transport)
+
+
+class _PooledStorageClient(AsyncStorageClient):
+    """AsyncStorageClient whose session sends through a shared transport"""
+    
+    def __init__(self, url: str, headers: dict, transport: httpx.AsyncHTTPTransport):
+        self._transport = transport
+        super().__init__(url, headers)
+    
+    def _create_session(self, base_url, headers, timeout) -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=base_url, headers=headers, timeout=timeout, transport=self._transport)
+
+
 class SupabaseService:
     """Handle Supabase operations for storage and database"""
     
     def __init__(self):
-        self.client: Client = create_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_KEY
+        settings = get_settings()
+        supabase_url = settings.SUPABASE_URL.rstrip("/")
+        headers = {
+            "apiKey": settings.SUPABASE_KEY,
+            "Authorization": f"Bearer {settings.SUPABASE_KEY}",
+        }
+        # One keep-alive pool with HTTP/2 for both APIs, which live on the
+        # same host, so uploads and inserts reuse connections
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE_CONNECTIONS
+            )
         )
+        # The async storage and PostgREST clients that supabase-py wraps,
+        # so uploads and inserts don't block the event loop
+        self.storage = _PooledStorageClient(f"{supabase_url}/storage/v1", headers, transport)
+        self.postgrest = _PooledPostgrestClient(f"{supabase_url}/rest/v1", transport, headers=headers)
         self.bucket_name = settings.SUPABASE_BUCKET_NAME
-        self._ensure_bucket_exists()
+        self._bucket_checked = False
+        self._bucket_lock = asyncio.Lock()
     
-    def _ensure_bucket_exists(self):
-        """Ensure the storage bucket exists"""
-        try:
-            buckets = self.client.storage.list_buckets()
-            bucket_names = [bucket.name for bucket in buckets]
-            
-            if self.bucket_name not in bucket_names:
-                self.client.storage.create_bucket(self.bucket_name)
-                logger.info(f"Created bucket: {self.bucket_name}")
-        except Exception as e:
-            logger.warning(f"Could not verify bucket existence: {str(e)}")
+    async def _ensure_bucket_exists(self):
+        """Ensure the storage bucket exists (checked once, before the first upload)"""
+        async with self._bucket_lock:
+            if self._bucket_checked:
+                return
+            try:
+                buckets = await self.storage.list_buckets()
+                bucket_names = [bucket.name for bucket in buckets]
+                
+                if self.bucket_name not in bucket_names:
+                    await self.storage.create_bucket(self.bucket_name)
+                    logger.info(f"Created bucket: {self.bucket_name}")
+            except Exception as e:
+                logger.warning(f"Could not verify bucket existence: {str(e)}")
+            self._bucket_checked = True
+    
+    async def close(self):
+        """Close the storage and database HTTP clients"""
+        await asyncio.gather(self.storage.aclose(), self.postgrest.aclose())
     
     async def upload_file(self, file: UploadFile, file_path: str) -> str:
         """
@@ -52,16 +102,17 @@ class SupabaseService:
             unique_filename = f"{uuid.uuid4()}.{file_ext}"
             storage_path = f"resumes/{unique_filename}"
             
-            # Read file content
-            with open(file_path, 'rb') as f:
-                file_content = f.read()
+            if not self._bucket_checked:
+                await self._ensure_bucket_exists()
             
-            # Upload to Supabase storage
-            self.client.storage.from_(self.bucket_name).upload(
-                path=storage_path,
-                file=file_content,
-                file_options={"content-type": file.content_type}
-            )
+            # Upload to Supabase storage, streaming the file from disk in
+            # chunks instead of reading it into memory first
+            with open(file_path, 'rb') as f:
+                await self.storage.from_(self.bucket_name).upload(
+                    path=storage_path,
+                    file=f,
+                    file_options={"content-type": file.content_type}
+                )
             
             logger.info(f"File uploaded to Supabase: {storage_path}")
             return storage_path
@@ -82,11 +133,11 @@ class SupabaseService:
         """
         try:
             # Add created_at timestamp
-            metadata["created_at"] = datetime.utcnow().isoformat()
+            metadata["created_at"] = datetime.now(timezone.utc).isoformat()
             metadata["id"] = str(uuid.uuid4())
             
             # Insert into resumes_metadata table
-            response = self.client.table("resumes_metadata").insert(metadata).execute()
+            response = await self.postgrest.table("resumes_metadata").insert(metadata).execute()
             
             if not response.data:
                 raise Exception("No data returned from insert")
@@ -99,6 +150,38 @@ class SupabaseService:
             logger.error(f"Error saving metadata to Supabase: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to save metadata: {str(e)}")
     
+    async def save_metadata_batch(self, rows: List[dict]) -> List[str]:
+        """
+        Save metadata for several files with one multi-row insert
+        
+        Args:
+            rows: Dictionaries containing file metadata
+            
+        Returns:
+            IDs of inserted records, in input order
+        """
+        if not rows:
+            return []
+        
+        try:
+            created_at = datetime.now(timezone.utc).isoformat()
+            for metadata in rows:
+                metadata["created_at"] = created_at
+                metadata["id"] = str(uuid.uuid4())
+            
+            response = await self.postgrest.table("resumes_metadata").insert(rows).execute()
+            
+            if len(response.data) != len(rows):
+                raise Exception(f"Insert returned {len(response.data)} of {len(rows)} rows")
+            
+            metadata_ids = [record["id"] for record in response.data]
+            logger.info(f"Metadata saved for {len(metadata_ids)} files")
+            return metadata_ids
+            
+        except Exception as e:
+            logger.error(f"Error saving metadata batch to Supabase: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to save metadata: {str(e)}")
+    
     async def get_metadata(self, metadata_id: str) -> dict:
         """
         Retrieve metadata by ID
@@ -110,7 +193,7 @@ class SupabaseService:
             Metadata dictionary
         """
         try:
-            response = self.client.table("resumes_metadata").select("*").eq("id", metadata_id).execute()
+            response = await self.postgrest.table("resumes_metadata").select("*").eq("id", metadata_id).execute()
             
             if not response.data:
                 return None
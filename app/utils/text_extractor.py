@@ -3,17 +3,120 @@
 Text extraction utilities for PDF and DOCX files with LaTeX cleanup
 """
 import PyPDF2
-from docx import Document
+from cachetools import LRUCache
+from lxml import etree
+from app.config import get_settings
 from app.core.logger import get_logger
+import asyncio
+import hashlib
+import logging
 import os
 import re
+import threading
+import zipfile
+
+try:
+    import pypdfium2 as pdfium  # optional: native PDF text extraction
+except ImportError:
+    pdfium = None
 
 logger = get_logger(__name__)
 
+# PyPDF2 logs a warning for every malformed object it recovers from, which
+# LaTeX-generated PDFs produce plenty of; only its errors are worth the
+# logging overhead
+logging.getLogger("PyPDF2").setLevel(logging.ERROR)
+
+# PDFium is not thread-safe, so extractions running in worker threads take
+# turns
+_PDFIUM_LOCK = threading.Lock()
+
+# DOCX packages: the relationship naming the main document part, and the
+# usual name of that part
+_PACKAGE_RELATIONSHIP = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+_OFFICE_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+_DEFAULT_DOCUMENT_PART = 'word/document.xml'
+
+# WordprocessingML tags read for DOCX text
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = f'{_W}body'
+_W_P = f'{_W}p'
+_W_R = f'{_W}r'
+_W_HYPERLINK = f'{_W}hyperlink'
+_W_T = f'{_W}t'
+_W_BR = f'{_W}br'
+_W_TYPE = f'{_W}type'
+# Text of the other run children, the same as python-docx gives them
+_RUN_CHILD_TEXT = {
+    f'{_W}cr': '\n',
+    f'{_W}noBreakHyphen': '-',
+    f'{_W}ptab': '\t',
+    f'{_W}tab': '\t',
+}
+
+
+def _run_text(run: etree._Element) -> str:
+    """Text of a w:r element"""
+    parts = []
+    for child in run.iterchildren(_W_T, _W_BR, *_RUN_CHILD_TEXT):
+        if child.tag == _W_T:
+            parts.append(child.text or '')
+        elif child.tag == _W_BR:
+            # Line breaks only; column and page breaks have no text
+            if child.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(_RUN_CHILD_TEXT[child.tag])
+    return ''.join(parts)
+
+
+# Replacements applied to extracted PDF text, in order. The LaTeX symbols
+# are removed before special spaces are normalised, so the separators only
+# match a plain space
+_REPLACEMENTS = (
+    # Email artifacts
+    ('ï', ''),  # Often appears before @
+    ('# ', ''),  # LaTeX phone/email separator
+    ('§ ', ''),  # LaTeX symbols
+    ('¶ ', ''),
+    
+    # Quote marks
+    ('\u201c', '"'),
+    ('\u201d', '"'),
+    ('\u2018', "'"),
+    ('\u2019', "'"),
+    
+    # Special spaces
+    ('\xa0', ' '),  # Non-breaking space
+    ('\u200b', ''),  # Zero-width space
+    
+    # LaTeX dash variants
+    ('–', '-'),  # en-dash
+    ('—', '-'),  # em-dash
+)
+
+# Pattern: lettersp@email or letterspandemail
+_RE_CORRUPTED_EMAIL = re.compile(r'([a-z])p@([a-z])', re.IGNORECASE)
+# Runs of two or more, so single spaces are not rewritten
+_RE_MULTIPLE_SPACES = re.compile(r' {2,}')
+_RE_SPACES_AROUND_AT = re.compile(r'\s*@\s*')
+
+
+def _file_digest(file_path: str) -> str:
+    """BLAKE2b digest of a file's content"""
+    with open(file_path, 'rb') as file:
+        return hashlib.file_digest(file, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
 
 class TextExtractor:
     """Extract text from PDF and DOCX files"""
     
+    def __init__(self):
+        settings = get_settings()
+        # Extracted text keyed by (extension, content digest), so re-uploads
+        # of the same resume skip parsing
+        self._text_cache = LRUCache(maxsize=settings.TEXT_CACHE_SIZE)
+    
     async def extract(self, file_path: str) -> str:
         """
         Extract text from file based on extension
@@ -27,11 +130,21 @@ class TextExtractor:
         file_ext = os.path.splitext(file_path)[1].lower()
         
         if file_ext == '.pdf':
-            return await self._extract_from_pdf(file_path)
+            extract = self._extract_from_pdf
         elif file_ext == '.docx':
-            return await self._extract_from_docx(file_path)
+            extract = self._extract_from_docx
         else:
             raise ValueError(f"Unsupported file type: {file_ext}")
+        
+        cache_key = (file_ext, await asyncio.to_thread(_file_digest, file_path))
+        text = self._text_cache.get(cache_key)
+        if text is not None:
+            logger.info(f"Reusing extracted text for identical {file_ext} file")
+            return text
+        
+        text = await extract(file_path)
+        self._text_cache[cache_key] = text
+        return text
     
     async def _extract_from_pdf(self, file_path: str) -> str:
         """
@@ -44,14 +157,8 @@ class TextExtractor:
             Extracted and cleaned text
         """
         try:
-            text = ""
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+            # Parsing is CPU-bound, so it runs in a worker thread
+            text = await asyncio.to_thread(self._read_pdf_text, file_path)
             
             # Clean LaTeX artifacts
             text = self._clean_latex_artifacts(text)
@@ -63,6 +170,54 @@ class TextExtractor:
             logger.error(f"Error extracting text from PDF: {str(e)}")
             raise
     
+    def _read_pdf_text(self, file_path: str) -> str:
+        """
+        Read the raw text of every PDF page, with PDFium when it is installed
+        
+        Args:
+            file_path: Path to PDF file
+            
+        Returns:
+            Raw text of all pages, each followed by a newline
+        """
+        if pdfium is not None:
+            try:
+                return self._read_pdf_text_pdfium(file_path)
+            except pdfium.PdfiumError as e:
+                logger.warning(f"PDFium could not read {file_path}, falling back to PyPDF2: {str(e)}")
+        
+        pages = []
+        with open(file_path, 'rb') as file:
+            # Recover from malformed PDFs instead of failing on them
+            pdf_reader = PyPDF2.PdfReader(file, strict=False)
+            
+            for page in pdf_reader.pages:
+                # Pages without a content stream have no text
+                if "/Contents" not in page:
+                    continue
+                page_text = page.extract_text()
+                if page_text:
+                    pages.append(page_text)
+                    pages.append("\n")
+        return "".join(pages)
+    
+    def _read_pdf_text_pdfium(self, file_path: str) -> str:
+        """Read the raw text of every PDF page with PDFium"""
+        pages = []
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                for page in pdf:
+                    page_text = page.get_textpage().get_text_range()
+                    if page_text:
+                        # PDFium ends lines with \r\n and marks soft
+                        # hyphens with U+FFFE
+                        pages.append(page_text.replace("\r\n", "\n").replace("\ufffe", ""))
+                        pages.append("\n")
+            finally:
+                pdf.close()
+        return "".join(pages)
+    
     async def _extract_from_docx(self, file_path: str) -> str:
         """
         Extract text from DOCX file
@@ -74,8 +229,7 @@ class TextExtractor:
             Extracted text
         """
         try:
-            doc = Document(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
+            text = await asyncio.to_thread(self._read_docx_text, file_path)
             
             logger.info(f"Extracted {len(text)} characters from DOCX")
             return text.strip()
@@ -84,6 +238,42 @@ class TextExtractor:
             logger.error(f"Error extracting text from DOCX: {str(e)}")
             raise
     
+    def _read_docx_text(self, file_path: str) -> str:
+        """
+        Read the text of the top-level DOCX body paragraphs straight from the
+        document XML, the same text python-docx's doc.paragraphs gives
+        
+        Args:
+            file_path: Path to DOCX file
+            
+        Returns:
+            Paragraph texts joined by newlines
+        """
+        # Same settings python-docx parses with, without its element classes
+        parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+        with zipfile.ZipFile(file_path) as package:
+            part_name = _DEFAULT_DOCUMENT_PART
+            for relationship in etree.fromstring(package.read('_rels/.rels'), parser).iter(_PACKAGE_RELATIONSHIP):
+                if relationship.get('Type') == _OFFICE_DOCUMENT:
+                    part_name = relationship.get('Target').lstrip('/')
+                    break
+            document = etree.fromstring(package.read(part_name), parser)
+        
+        body = document.find(_W_BODY)
+        if body is None:
+            return ""
+        
+        paragraphs = []
+        for paragraph in body.iterchildren(_W_P):
+            parts = []
+            for child in paragraph.iterchildren(_W_R, _W_HYPERLINK):
+                if child.tag == _W_R:
+                    parts.append(_run_text(child))
+                else:
+                    parts.extend(_run_text(run) for run in child.iterchildren(_W_R))
+            paragraphs.append(''.join(parts))
+        return "\n".join(paragraphs)
+    
     def _clean_latex_artifacts(self, text: str) -> str:
         """
         Clean common LaTeX PDF extraction artifacts
@@ -94,41 +284,21 @@ class TextExtractor:
         Returns:
             Cleaned text
         """
-        # Remove common LaTeX symbol replacements that PyPDF2 misreads
-        replacements = {
-            # Email artifacts
-            'ï': '',  # Often appears before @
-            'ï ': '',
-            '# ': '',  # LaTeX phone/email separator
-            '§ ': '',  # LaTeX symbols
-            '¶ ': '',
-            
-            # Quote marks
-            '"': '"',
-            '"': '"',
-            ''': "'",
-            ''': "'",
-            
-            # Special spaces
-            '\xa0': ' ',  # Non-breaking space
-            '\u200b': '',  # Zero-width space
-            
-            # LaTeX dash variants
-            '–': '-',  # en-dash
-            '—': '-',  # em-dash
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        # Remove common LaTeX symbol replacements that PyPDF2 misreads.
+        # '# ' is the only ASCII one, so ASCII text needs a single pass
+        if text.isascii():
+            text = text.replace('# ', '')
+        else:
+            for old, new in _REPLACEMENTS:
+                text = text.replace(old, new)
         
         # Fix email patterns where @ gets corrupted
-        # Pattern: lettersp@email or letterspandemail
-        text = re.sub(r'([a-z])p@([a-z])', r'\1@\2', text, flags=re.IGNORECASE)
+        text = _RE_CORRUPTED_EMAIL.sub(r'\1@\2', text)
         
         # Remove multiple spaces
-        text = re.sub(r' +', ' ', text)
+        text = _RE_MULTIPLE_SPACES.sub(' ', text)
         
         # Remove spaces around @
-        text = re.sub(r'\s*@\s*', '@', text)
+        text = _RE_SPACES_AROUND_AT.sub('@', text)
         
         return text
\ No newline at end of file
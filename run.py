@@ -1,10 +1,10 @@
 import uvicorn
-from app.config import settings
+from app.config import get_settings
 
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=get_settings().DEBUG
     )
@@ -0,0 +1,154 @@
+# tests/conftest.py
+"""
+Shared test setup: placeholder settings, an app client and fake MongoDB and Groq clients
+"""
+import os
+from types import SimpleNamespace
+
+import pytest
+
+# Settings are required at import time; tests never reach these services
+os.environ.setdefault("SUPABASE_URL", "http://supabase.test")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+os.environ.setdefault("MONGODB_URL", "mongodb://localhost:27017")
+os.environ.setdefault("HUGGINGFACE_API_KEY", "test-key")
+
+
+class FakeMongoDB:
+    """In-memory stand-in for MongoDBService, newest candidates first"""
+    
+    def __init__(self, *candidates):
+        self.candidates = list(candidates)
+    
+    def _summary(self, candidate):
+        return {
+            "id": candidate["candidate_id"],
+            "candidate_id": candidate["candidate_id"],
+            "name": None,
+            "skills": candidate.get("skills", [])[:5],
+            "experience_years": None,
+            "created_at": None,
+        }
+    
+    async def get_candidate(self, candidate_id):
+        return next((c for c in self.candidates if c["candidate_id"] == candidate_id), None)
+    
+    async def iter_candidate_summaries(self, skip=0, limit=20):
+        for candidate in self.candidates[skip:skip + limit]:
+            yield self._summary(candidate)
+    
+    async def list_candidate_summaries(self, skip=0, limit=20):
+        return [summary async for summary in self.iter_candidate_summaries(skip, limit)]
+
+
+@pytest.fixture
+def mongodb():
+    return FakeMongoDB(*(
+        {"candidate_id": f"cand-{i}", "introduction": f"Candidate {i}", "skills": ["Python", "SQL"]}
+        for i in range(5)
+    ))
+
+
+@pytest.fixture
+def client(mongodb):
+    """TestClient for the app with MongoDB replaced by a fake"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.core.dependencies import get_mongodb_service
+    
+    app.dependency_overrides[get_mongodb_service] = lambda: mongodb
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def hf_service():
+    """A HuggingFaceService; tests replace its Groq client"""
+    from app.services.huggingface_service import HuggingFaceService
+    return HuggingFaceService()
+
+
+def completion(content: str) -> SimpleNamespace:
+    """A chat completion with the given message content"""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def chunk(content: str) -> SimpleNamespace:
+    """One chunk of a streamed chat completion"""
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class FakeGroq:
+    """
+    Stand-in for the Groq inference client: replies are taken in order
+    from `replies` (strings, lists of stream chunks, or exceptions to raise)
+    """
+    
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = []
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+    
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        reply = self.replies.pop(0) if self.replies else ""
+        if isinstance(reply, Exception):
+            raise reply
+        if kwargs.get("stream"):
+            return _Stream(reply)
+        return completion(reply)
+    
+    async def close(self):
+        self.closed = True
+
+
+class _Stream:
+    """Async iterator over stream chunks"""
+    
+    def __init__(self, parts):
+        self._parts = iter(parts)
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        try:
+            return chunk(next(self._parts))
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def make_pdf(path, *lines):
+    """Write a one-page PDF showing the given lines of text"""
+    stream = "BT /F1 12 Tf 72 720 Td 14 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        "/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream",
+    ]
+    pdf = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    with open(path, "w", encoding="latin-1") as f:
+        f.write(pdf)
+    return path
+
+
+def make_docx(path, *paragraphs):
+    """Write a DOCX file with the given paragraphs"""
+    import docx
+    document = docx.Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    document.save(path)
+    return path
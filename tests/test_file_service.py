@@ -0,0 +1,54 @@
+# tests/test_file_service.py
+"""
+Tests for upload validation and saving
+"""
+import asyncio
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.services.file_service import CHUNK_SIZE, FileService
+
+
+@pytest.fixture
+def file_service(tmp_path):
+    service = FileService()
+    service.upload_dir = str(tmp_path)
+    return service
+
+
+def _upload(filename: str, data: bytes = b"") -> UploadFile:
+    return UploadFile(io.BytesIO(data), filename=filename)
+
+
+def test_save_file_streams_to_disk(file_service, tmp_path):
+    data = bytes(range(256)) * (CHUNK_SIZE // 64)  # several chunks
+    
+    path, size = asyncio.run(file_service.save_file(_upload("resume.pdf", data)))
+    
+    assert path == str(tmp_path / "resume.pdf")
+    assert size == len(data)
+    assert (tmp_path / "resume.pdf").read_bytes() == data
+
+
+def test_save_file_rejects_oversized_upload(file_service, tmp_path):
+    file_service.max_file_size = CHUNK_SIZE
+    
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(file_service.save_file(_upload("resume.pdf", b"x" * (CHUNK_SIZE + 1))))
+    
+    assert error.value.status_code == 400
+    assert not (tmp_path / "resume.pdf").exists()
+
+
+@pytest.mark.parametrize("filename", ["resume.pdf", "resume.DOCX", "my.cv.Pdf"])
+def test_validate_file_accepts_allowed_extensions(file_service, filename):
+    file_service.validate_file(_upload(filename))
+
+
+@pytest.mark.parametrize("filename", ["resume.txt", "resume", "pdf", "resume.pdf.exe"])
+def test_validate_file_rejects_other_extensions(file_service, filename):
+    with pytest.raises(HTTPException) as error:
+        file_service.validate_file(_upload(filename))
+    assert error.value.status_code == 400
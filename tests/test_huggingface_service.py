@@ -0,0 +1,435 @@
+# tests/test_huggingface_service.py
+"""
+Tests for the Groq-backed extraction and Q&A service
+"""
+import asyncio
+import json
+
+import pytest
+
+from tests.conftest import FakeGroq, completion
+
+SAMPLE_REPLY = """```json
+{
+  "introduction": "Backend developer",
+  "education": {"degree": "B.Tech", "institution": "IIT", "year": 2021},
+  "experience": {"total_years": 3, "companies": "Acme", "positions": "Engineer"},
+  "skills": ["Python", "FastAPI"],
+  "projects": [{"name": "Parser", "description": "Parses resumes"}],
+  "hobbies": "chess",
+  "extra": true
+}
+```"""
+
+SAMPLE_RESULT = {
+    "introduction": "Backend developer",
+    "education": {"degree": "B.Tech", "institution": "IIT", "field": "", "year": "2021"},
+    "experience": {"total_years": "3", "companies": "Acme", "positions": "Engineer"},
+    "skills": ["Python", "FastAPI"],
+    "projects": [{"name": "Parser", "description": "Parses resumes"}],
+    "hobbies": [],
+    "certifications": [],
+}
+
+
+def test_clean_and_validate_sample_reply(hf_service):
+    cleaned = hf_service._clean_json_response(SAMPLE_REPLY)
+    assert hf_service._validate_and_fix_structure(json.loads(cleaned)) == SAMPLE_RESULT
+
+
+def test_clean_json_response_ignores_braces_around_the_object(hf_service):
+    reply = 'Here you go: {"introduction": "Dev {Python} \\"ok}\\"", "skills": []}\nUse {placeholders} freely.'
+    
+    cleaned = hf_service._clean_json_response(reply)
+    
+    assert json.loads(cleaned) == {"introduction": 'Dev {Python} "ok}"', "skills": []}
+
+
+def test_clean_json_response_without_object(hf_service):
+    assert hf_service._clean_json_response("no json here") == "no json here"
+
+
+def test_extract_resume_info_falls_back_on_error(hf_service):
+    hf_service.client = FakeGroq(RuntimeError("boom"))
+    
+    result = asyncio.run(hf_service.extract_resume_info("Jane Doe"))
+    
+    assert result == hf_service._get_default_structure()
+    assert result["education"] == {"degree": "", "institution": "", "field": "", "year": ""}
+
+
+CANDIDATE = {
+    "candidate_id": "cand-1",
+    "introduction": "Jane Doe | Email: jane@example.com | Phone: +1 415 555 0100",
+    "skills": ["Python", "FastAPI"],
+    "hobbies": ["Chess"],
+    "education": {"degree": "B.Tech", "institution": "IIT", "field": "CS", "year": "2021"},
+    "experience": {"total_years": "3 years", "companies": "Acme", "positions": "Engineer"},
+    "projects": ["Resume Parser"],
+    "certifications": ["AWS Certified Developer"],
+}
+
+
+@pytest.mark.parametrize("question, expected", [
+    ("What is the candidate name?", "Jane Doe"),
+    ("What are their skills?", "Python, FastAPI"),
+    ("Any hobbies?", "Chess"),
+    ("What degree do they have?", "B.Tech"),
+    ("How many years of experience?", "Acme"),
+    ("What projects have they built?", "Resume Parser"),
+    ("Any certifications?", "AWS Certified Developer"),
+    ("What is their email?", "jane@example.com"),
+])
+def test_rule_based_answer(hf_service, question, expected):
+    assert expected in hf_service._try_rule_based_answer(question, CANDIDATE)
+
+
+def test_rule_based_answer_leaves_open_questions_to_the_llm(hf_service):
+    assert hf_service._try_rule_based_answer("Would she fit a startup team?", CANDIDATE) is None
+
+
+def test_rule_based_answer_uses_canned_answers(hf_service):
+    canned = hf_service.precompute_canned_answers(CANDIDATE)
+    assert "Python, FastAPI" in canned["skills"]
+    
+    candidate = {**CANDIDATE, "skills": [], "_canned": {**canned, "skills": "Canned skills"}}
+    assert hf_service._try_rule_based_answer("What are their skills?", candidate) == "Canned skills"
+
+
+def test_answer_uses_stored_context(hf_service):
+    hf_service.client = FakeGroq("She has shipped Python APIs.")
+    candidate = {**CANDIDATE, "_context": "Stored context"}
+    
+    asyncio.run(hf_service.answer_question("Would she fit a startup team?", candidate))
+    
+    assert "Stored context" in hf_service.client.calls[0]["messages"][1]["content"]
+
+
+def test_extraction_cached(hf_service):
+    hf_service.client = FakeGroq(SAMPLE_REPLY)
+    
+    first = asyncio.run(hf_service.extract_resume_info("Jane Doe\nPython developer"))
+    first["candidate_id"] = "mutated"
+    second = asyncio.run(hf_service.extract_resume_info("Jane Doe\nPython developer"))
+    
+    assert second == SAMPLE_RESULT
+    assert len(hf_service.client.calls) == 1
+
+
+def test_answer_cached(hf_service):
+    hf_service.client = FakeGroq("She has shipped Python APIs.")
+    
+    answers = [
+        asyncio.run(hf_service.answer_question(question, CANDIDATE))
+        for question in ("Would she fit a startup team?", "  would she FIT a startup team? ")
+    ]
+    
+    assert answers == ["She has shipped Python APIs."] * 2
+    assert len(hf_service.client.calls) == 1
+
+
+def test_cached_answer_expires(hf_service):
+    from cachetools import TTLCache
+    
+    clock = [0]
+    hf_service._answer_cache = TTLCache(maxsize=8, ttl=60, timer=lambda: clock[0])
+    hf_service.client = FakeGroq("She has shipped Python APIs.", "She now leads a Go team.")
+    question = "Would she fit a startup team?"
+    
+    assert asyncio.run(hf_service.answer_question(question, CANDIDATE)) == "She has shipped Python APIs."
+    clock[0] = 61
+    assert asyncio.run(hf_service.answer_question(question, CANDIDATE)) == "She now leads a Go team."
+
+
+def test_concurrent_extractions_share_the_event_loop(hf_service):
+    hf_service.client = FakeGroq(SAMPLE_REPLY, SAMPLE_REPLY)
+    
+    async def extract_both():
+        return await asyncio.gather(
+            hf_service.extract_resume_info("First resume"),
+            hf_service.extract_resume_info("Second resume"),
+        )
+    
+    assert asyncio.run(extract_both()) == [SAMPLE_RESULT, SAMPLE_RESULT]
+    asyncio.run(hf_service.close())
+    assert hf_service.client.closed
+
+
+def test_batch_extraction_bounds_concurrency(hf_service):
+    hf_service.BATCH_CONCURRENCY = 2
+    running = []
+    peak = []
+    
+    async def extract(resume_text):
+        running.append(resume_text)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(resume_text)
+        return {"introduction": resume_text}
+    
+    hf_service.extract_resume_info = extract
+    texts = [f"Resume {i}" for i in range(5)]
+    
+    results = asyncio.run(hf_service.extract_resume_infos_batch(texts))
+    
+    assert [r["introduction"] for r in results] == texts  # input order
+    assert max(peak) == 2
+
+
+def test_truncate_resume_text_keeps_head_and_tail():
+    from app.services.huggingface_service import _truncate_resume_text
+    
+    short = "Jane Doe\nPython"
+    assert _truncate_resume_text(short) is short
+    
+    text = "Jane Doe | jane@example.com\n" + "filler line\n" * 1000 + "SKILLS\nPython, FastAPI"
+    truncated = _truncate_resume_text(text)
+    
+    assert len(truncated) < 4100
+    assert truncated.startswith("Jane Doe | jane@example.com")
+    assert truncated.endswith("SKILLS\nPython, FastAPI")
+
+
+def test_extraction_params_scale_with_input(hf_service):
+    model, max_tokens = hf_service._extraction_params("Jane Doe\nPython")
+    assert model == hf_service.fast_model
+    assert max_tokens < 1500
+    
+    model, max_tokens = hf_service._extraction_params("x" * 8000)
+    assert model == hf_service.model
+    assert max_tokens == 1500
+
+
+def _stream_clients(hf_service, *replies):
+    """Give each stream its own FakeGroq with the next reply; returns them all"""
+    clients = []
+    
+    def new_client():
+        clients.append(FakeGroq(replies[len(clients)]))
+        return clients[-1]
+    
+    hf_service._inference_client = new_client
+    return clients
+
+
+def test_extract_resume_info_stream(hf_service):
+    reply = SAMPLE_REPLY.split("```json")[1].split("```")[0]
+    clients = _stream_clients(hf_service, [reply[i:i + 7] for i in range(0, len(reply), 7)])
+    
+    async def collect():
+        return [item async for item in hf_service.extract_resume_info_stream("Jane Doe")]
+    
+    assert dict(asyncio.run(collect())) == SAMPLE_RESULT
+    assert clients[0].closed
+
+
+def test_extract_resume_info_stream_closed_early(hf_service):
+    clients = _stream_clients(hf_service, ['{"introduction": "Jane", "skills": ["Go"], '])
+    
+    async def first_field():
+        stream = hf_service.extract_resume_info_stream("Jane Doe")
+        field = await stream.__anext__()
+        await stream.aclose()
+        return field
+    
+    assert asyncio.run(first_field()) == ("introduction", "Jane")
+    assert clients[0].closed
+
+
+def test_extract_resume_info_stream_error_falls_back(hf_service):
+    clients = _stream_clients(hf_service, RuntimeError("offline"))
+    
+    async def collect():
+        return dict([item async for item in hf_service.extract_resume_info_stream("Jane Doe")])
+    
+    assert asyncio.run(collect()) == hf_service._get_default_structure()
+    assert clients[0].closed
+
+
+OPEN_QUESTION = "Would Jane fit well in a fast-moving startup team?"
+
+
+def test_answer_question_stream(hf_service):
+    clients = _stream_clients(hf_service, ["Yes", ", she has ", "shipped APIs."])
+    
+    async def collect():
+        return [piece async for piece in hf_service.answer_question_stream(OPEN_QUESTION, CANDIDATE)]
+    
+    assert "".join(asyncio.run(collect())) == "Yes, she has shipped APIs."
+    assert clients[0].closed
+    # The finished answer is cached for the non-streaming endpoint too
+    assert asyncio.run(hf_service.answer_question(OPEN_QUESTION, CANDIDATE)) == "Yes, she has shipped APIs."
+
+
+def test_answer_question_stream_closed_early(hf_service):
+    clients = _stream_clients(hf_service, ["Yes, she has ", "shipped APIs."])
+    
+    async def first_piece():
+        stream = hf_service.answer_question_stream(OPEN_QUESTION, CANDIDATE)
+        piece = await stream.__anext__()
+        await stream.aclose()
+        return piece
+    
+    assert asyncio.run(first_piece()) == "Yes, she has "
+    assert clients[0].closed
+
+
+def test_is_retryable():
+    import httpx
+    from huggingface_hub.errors import HfHubHTTPError
+    from app.services.huggingface_service import _is_retryable
+    
+    request = httpx.Request("POST", "https://router.huggingface.co")
+    assert _is_retryable(HfHubHTTPError("busy", response=httpx.Response(503, request=request)))
+    assert not _is_retryable(HfHubHTTPError("bad", response=httpx.Response(400, request=request)))
+    detached = HfHubHTTPError("no response", response=httpx.Response(503, request=request))
+    detached.response = None
+    assert not _is_retryable(detached)
+    assert _is_retryable(httpx.ConnectError("down"))
+    assert not _is_retryable(ValueError("bad"))
+
+
+def test_retry_after():
+    import httpx
+    from huggingface_hub.errors import HfHubHTTPError
+    from app.services.huggingface_service import _retry_after
+    
+    def error(headers):
+        request = httpx.Request("POST", "https://router.huggingface.co")
+        return HfHubHTTPError("busy", response=httpx.Response(429, headers=headers, request=request))
+    
+    assert _retry_after(error({"Retry-After": "2"})) == 2.0
+    assert _retry_after(error({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})) is None
+    assert _retry_after(error({})) is None
+    assert _retry_after(ValueError("bad")) is None
+
+
+def test_extraction_retries_transient_errors(hf_service):
+    import httpx
+    
+    hf_service.client = FakeGroq(httpx.ConnectError("down"), SAMPLE_REPLY)
+    
+    result = asyncio.run(hf_service.extract_resume_info("Jane Doe"))
+    
+    assert result == SAMPLE_RESULT
+    assert len(hf_service.client.calls) == 2
+
+
+def test_groq_requests_go_through_the_service_pool(hf_service, monkeypatch):
+    import httpx
+    from huggingface_hub.hf_api import InferenceProviderMapping
+    from huggingface_hub.inference._providers import _common
+    
+    # Resolve every model to Groq without asking the Hub
+    monkeypatch.setattr(_common, "_fetch_inference_provider_mapping", lambda model: [
+        InferenceProviderMapping(provider="groq", hf_model_id=model, providerId=model, status="live", task="conversational")
+    ])
+    message = {"index": 0, "message": {"role": "assistant", "content": SAMPLE_REPLY}, "finish_reason": "stop"}
+    delta = {"index": 0, "delta": {"role": "assistant", "content": '{"introduction": "Jane"}'}}
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        if json.loads(request.content).get("stream"):
+            events = f"data: {json.dumps({'choices': [delta]})}\n\ndata: [DONE]\n\n"
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, text=events)
+        return httpx.Response(200, json={"choices": [message]})
+    
+    hf_service._pool = httpx.MockTransport(handler)
+    
+    async def run():
+        extracted = await hf_service.extract_resume_info("Jane Doe")
+        streamed = dict([item async for item in hf_service.extract_resume_info_stream("John Roe")])
+        await hf_service.close()
+        return extracted, streamed
+    
+    extracted, streamed = asyncio.run(run())
+    
+    assert extracted == SAMPLE_RESULT
+    assert streamed["introduction"] == "Jane"
+    assert len(requests) == 2
+    assert all(request.headers["authorization"] == "Bearer test-key" for request in requests)
+
+
+class _ModelGroq(FakeGroq):
+    """FakeGroq whose reply depends on the model asked: a (delay, reply) pair per model"""
+    
+    def __init__(self, replies):
+        super().__init__()
+        self.by_model = replies
+        self.cancelled = []
+    
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        delay, reply = self.by_model[kwargs["model"]]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(kwargs["model"])
+            raise
+        if isinstance(reply, Exception):
+            raise reply
+        return completion(reply)
+
+
+def test_ask_hedged_falls_back_on_error(hf_service):
+    import httpx
+    
+    primary, fallback = hf_service.qa_models
+    hf_service.hedge_delay = 5
+    hf_service.client = _ModelGroq({primary: (0, httpx.ConnectError("overloaded")), fallback: (0, "Fallback answer.")})
+    
+    assert asyncio.run(hf_service._ask_hedged("prompt")) == "Fallback answer."
+    # The primary model is not retried once the fallback is in play
+    assert [call["model"] for call in hf_service.client.calls] == [primary, fallback]
+
+
+def test_ask_hedged_slow_primary(hf_service):
+    primary, fallback = hf_service.qa_models
+    hf_service.hedge_delay = 0.01
+    hf_service.client = _ModelGroq({primary: (5, "Primary answer."), fallback: (0, "Fallback answer.")})
+    
+    assert asyncio.run(hf_service._ask_hedged("prompt")) == "Fallback answer."
+    assert hf_service.client.cancelled == [primary]
+
+
+def test_ask_hedged_fast_primary(hf_service):
+    primary, fallback = hf_service.qa_models
+    hf_service.hedge_delay = 5
+    hf_service.client = _ModelGroq({primary: (0, "Primary answer."), fallback: (0, "Fallback answer.")})
+    
+    assert asyncio.run(hf_service._ask_hedged("prompt")) == "Primary answer."
+    assert [call["model"] for call in hf_service.client.calls] == [primary]
+
+
+@pytest.mark.parametrize("question, expected", [
+    ("what are their skills and hobbies?", {"skills", "hobbies"}),
+    ("where did they go to college?", {"education"}),
+    ("what is their email address?", {"contact"}),
+    ("would she fit a startup team?", set()),
+])
+def test_question_categories(question, expected):
+    from app.services.huggingface_service import _question_categories
+    
+    assert _question_categories(question) == expected
+
+
+@pytest.mark.parametrize("intro, expected", [
+    ("Jane Doe | Email: jane@example.com", "Jane Doe"),
+    ("Jane Doe Email: jane@example.com", "Jane Doe"),
+    ("Jane Doe", "Jane Doe"),
+])
+def test_extract_name(intro, expected):
+    from app.services.huggingface_service import _extract_name
+    
+    assert _extract_name(intro) == expected
+
+
+def test_request_bodies_encoded_with_orjson():
+    import orjson
+    from app.services.huggingface_service import _ORJSONAsyncClient
+    
+    request = _ORJSONAsyncClient().build_request("POST", "https://router.test", json={"question": "Café?"})
+    
+    assert request.content == orjson.dumps({"question": "Café?"})
+    assert request.headers["content-type"] == "application/json"
@@ -0,0 +1,14 @@
+# tests/test_logger.py
+"""
+Tests for the logging setup
+"""
+from app.core.logger import get_logger
+
+
+def test_loggers_share_one_formatter():
+    first = get_logger("tests.logger.first")
+    second = get_logger("tests.logger.second")
+    
+    assert first.handlers[0].formatter is second.handlers[0].formatter
+    # Asking again doesn't add another handler
+    assert get_logger("tests.logger.first").handlers == first.handlers
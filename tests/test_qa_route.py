@@ -0,0 +1,84 @@
+# tests/test_qa_route.py
+"""
+Tests for the Q&A route helpers
+"""
+import pytest
+
+from app.core.dependencies import get_hf_service, get_mongodb_service
+from app.routes.qa import _has_minimal_data
+
+CANDIDATE = {"candidate_id": "cand-1", "introduction": "Jane Doe", "skills": ["Python"]}
+
+
+class FakeMongoDB:
+    async def get_candidate(self, candidate_id):
+        return CANDIDATE if candidate_id == CANDIDATE["candidate_id"] else None
+
+
+class FakeHFService:
+    async def answer_question(self, question, candidate_data):
+        return f"Answer about {candidate_data['introduction']}"
+    
+    async def answer_question_stream(self, question, candidate_data):
+        for piece in ("Answer about ", candidate_data["introduction"]):
+            yield piece
+
+
+@pytest.fixture
+def qa_client(client):
+    client.app.dependency_overrides[get_mongodb_service] = FakeMongoDB
+    client.app.dependency_overrides[get_hf_service] = FakeHFService
+    yield client
+    client.app.dependency_overrides.clear()
+
+
+def test_ask(qa_client):
+    response = qa_client.post("/ask/cand-1", json={"question": "Tell me about them"})
+    
+    assert response.status_code == 200
+    assert response.json()["answer"] == "Answer about Jane Doe"
+
+
+def test_ask_stream(qa_client):
+    response = qa_client.post("/ask/cand-1/stream", json={"question": "Tell me about them"})
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.text == "Answer about Jane Doe"
+
+
+@pytest.mark.parametrize("suffix", ["", "/stream"])
+@pytest.mark.parametrize("candidate_id", ["bad$id", "bad.id", "caf\u00e9"])
+def test_ask_invalid_candidate_id(qa_client, candidate_id, suffix):
+    # Rejected by the handler's own check (400), not request validation (422)
+    response = qa_client.post(f"/ask/{candidate_id}{suffix}", json={"question": "Tell me about them"})
+    assert response.status_code == 400
+
+
+def test_ask_unknown_candidate(qa_client):
+    response = qa_client.post("/ask/nobody", json={"question": "Tell me about them"})
+    assert response.status_code == 404
+
+
+def test_ask_empty_question(qa_client):
+    response = qa_client.post("/ask/cand-1", json={"question": "   "})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("candidate", [
+    {"skills": ["Python"]},
+    {"introduction": "Jane Doe"},
+    {"education": {"degree": "B.Tech"}},
+    {"description": "Backend developer"},
+])
+def test_has_minimal_data(candidate):
+    assert _has_minimal_data(candidate)
+
+
+@pytest.mark.parametrize("candidate", [
+    {},
+    {"skills": [], "introduction": "   "},
+    {"candidate_id": "abc", "created_at": "2024-01-01"},
+])
+def test_has_minimal_data_without_usable_fields(candidate):
+    assert not _has_minimal_data(candidate)
@@ -0,0 +1,72 @@
+# tests/test_resume_parser.py
+"""
+Tests for the regex-based resume parser
+"""
+import asyncio
+
+import pytest
+
+from app.services import resume_parser
+from app.services.resume_parser import ResumeParser, _KeywordScanner, _LinearPattern
+
+ENGINES = ["re", pytest.param("re2", marks=pytest.mark.skipif(
+    resume_parser.re2 is None, reason="google-re2 is not installed"
+))]
+SCANNERS = ["regex", pytest.param("automaton", marks=pytest.mark.skipif(
+    resume_parser.ahocorasick is None, reason="pyahocorasick is not installed"
+))]
+
+RESUME = (
+    "Jane Doe\njane@example.com | +1 415 555 0100\n\n"
+    "SKILLS\nPython, FastAPI, Docker\n\n"
+    "CERTIFICATIONS\nAWS Certified Developer\n\n"
+    "HOBBIES\nChess, hiking\n"
+)
+
+
+def test_parse_resume():
+    parser = ResumeParser()
+    
+    result = asyncio.run(parser.parse_resume(RESUME))
+    
+    assert "jane@example.com" in result["introduction"]
+    assert {"Python", "FastAPI", "Docker"} <= set(result["skills"])
+    assert "AWS Certified Developer" in result["certifications"]
+    assert {"Chess", "hiking"} <= set(result["hobbies"])
+    # Repeated texts are served from the cache as independent copies
+    result["skills"].append("mutated")
+    assert "mutated" not in asyncio.run(parser.parse_resume(RESUME))["skills"]
+
+
+@pytest.mark.parametrize("scanner", SCANNERS)
+def test_keyword_scanner_matches_whole_words(scanner, monkeypatch):
+    if scanner == "regex":
+        monkeypatch.setattr(resume_parser, "ahocorasick", None)
+    keywords = _KeywordScanner(["C", "C++", "Go", "Java", "JavaScript"])
+    
+    assert keywords.find("C++11, javascript and Google") == {"C", "C++", "JavaScript"}
+
+
+def _pattern(source: str, engine: str) -> _LinearPattern:
+    pattern = _LinearPattern(source)
+    if engine == "re":
+        pattern._re2 = None
+    return pattern
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("text", [
+    "AWS Certified Developer\n",
+    "AWS CERTİFİED Developer\n",  # dotted capital I folds to i in re only
+    "aws certıfıed developer\n",  # dotless i folds to I in re only
+    "AWS Certified – Développeur, more\n",
+])
+def test_linear_pattern_matches_like_re(engine, text):
+    source = r'(AWS Certified[A-Za-z\s\-]*?)(?:\n|,|\||$)'
+    assert _pattern(source, engine).findall(text) == _pattern(source, "re").findall(text)
+
+
+def test_find_section_prefers_keyword_order():
+    text = "Academic\nIIT Bombay\n\nEducation:\nB.Tech, CS\n\nSKILLS\nPython"
+    
+    assert ResumeParser()._find_section(text, resume_parser._EDUCATION_SECTION) == "B.Tech, CS"
@@ -0,0 +1,33 @@
+# tests/test_routes.py
+"""
+Smoke tests for the HTTP endpoints
+"""
+import orjson
+
+
+def test_root_and_health(client):
+    # The pre-rendered responses can be sent any number of times
+    for _ in range(2):
+        assert client.get("/").json()["status"] == "running"
+        assert client.get("/health").json() == {"status": "healthy"}
+
+
+def test_list_candidates_paginates(client):
+    response = client.get("/candidates", params={"skip": 1, "limit": 2})
+    
+    assert response.status_code == 200
+    assert [c["candidate_id"] for c in response.json()] == ["cand-1", "cand-2"]
+
+
+def test_list_candidates_rejects_bad_page(client):
+    assert client.get("/candidates", params={"limit": 101}).status_code == 422
+    assert client.get("/candidates", params={"skip": -1}).status_code == 422
+
+
+def test_stream_candidates_ndjson(client):
+    response = client.get("/candidates/stream", params={"skip": 3})
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.content.splitlines()
+    assert [orjson.loads(line)["candidate_id"] for line in lines] == ["cand-3", "cand-4"]
@@ -0,0 +1,61 @@
+# tests/test_supabase_service.py
+"""
+Tests for the Supabase storage and metadata service
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.services.supabase_service import SupabaseService
+
+
+@pytest.fixture
+def supabase():
+    """A SupabaseService answering from a mock transport; yields (service, requests)"""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/bucket"):
+            return httpx.Response(200, json=[{"name": "resumes"}])
+        if "/object/" in request.url.path:
+            return httpx.Response(200, json={"Key": "resumes/x"})
+        rows = json.loads(request.content)
+        return httpx.Response(201, json=rows if isinstance(rows, list) else [rows])
+    
+    service = SupabaseService()
+    # Both clients send through the same connection pool
+    assert service.storage.session._transport is service.postgrest.session._transport
+    service.storage.session._transport = service.postgrest.session._transport = httpx.MockTransport(handler)
+    return service, requests
+
+
+def test_upload_and_save_metadata(supabase, tmp_path):
+    service, requests = supabase
+    resume = tmp_path / "resume.pdf"
+    resume.write_bytes(b"%PDF-1.4")
+    upload = SimpleNamespace(filename="resume.pdf", content_type="application/pdf")
+    
+    async def run():
+        storage_path = await service.upload_file(upload, str(resume))
+        return storage_path, await service.save_metadata({"filename": "resume.pdf"})
+    
+    storage_path, metadata_id = asyncio.run(run())
+    
+    assert storage_path.startswith("resumes/") and storage_path.endswith(".pdf")
+    assert metadata_id
+    assert [r.url.host for r in requests] == ["supabase.test"] * len(requests)
+
+
+def test_save_metadata_batch(supabase):
+    service, requests = supabase
+    rows = [{"filename": f"{i}.pdf"} for i in range(3)]
+    
+    ids = asyncio.run(service.save_metadata_batch(rows))
+    
+    assert ids == [row["id"] for row in rows]
+    assert len(requests) == 1  # one multi-row insert
+    assert asyncio.run(service.save_metadata_batch([])) == []
@@ -0,0 +1,60 @@
+# tests/test_text_extractor.py
+"""
+Tests for PDF/DOCX text extraction
+"""
+import asyncio
+import shutil
+
+import pytest
+
+from app.utils import text_extractor
+from app.utils.text_extractor import TextExtractor
+from tests.conftest import make_docx, make_pdf
+
+PDF_READERS = ["PyPDF2", pytest.param("pdfium", marks=pytest.mark.skipif(
+    text_extractor.pdfium is None, reason="pypdfium2 is not installed"
+))]
+
+
+@pytest.mark.parametrize("reader", PDF_READERS)
+def test_extract_pdf(reader, tmp_path, monkeypatch):
+    if reader == "PyPDF2":
+        monkeypatch.setattr(text_extractor, "pdfium", None)
+    path = make_pdf(tmp_path / "resume.pdf", "Jane Doe", "Skills: Python, FastAPI")
+    
+    assert asyncio.run(TextExtractor().extract(str(path))) == "Jane Doe\nSkills: Python, FastAPI"
+
+
+def test_extract_docx(tmp_path):
+    path = make_docx(tmp_path / "resume.docx", "Jane Doe", "Skills: Python, FastAPI")
+    
+    assert asyncio.run(TextExtractor().extract(str(path))) == "Jane Doe\nSkills: Python, FastAPI"
+
+
+def test_identical_files_extracted_once(tmp_path, monkeypatch):
+    extractor = TextExtractor()
+    first = make_docx(tmp_path / "first.docx", "Jane Doe")
+    second = tmp_path / "second.docx"
+    shutil.copy(first, second)
+    reads = []
+    read_docx_text = extractor._read_docx_text
+    monkeypatch.setattr(extractor, "_read_docx_text", lambda path: reads.append(path) or read_docx_text(path))
+    
+    texts = [asyncio.run(extractor.extract(str(path))) for path in (first, second)]
+    
+    assert texts == ["Jane Doe", "Jane Doe"]
+    assert reads == [str(first)]
+
+
+def test_unsupported_extension(tmp_path):
+    with pytest.raises(ValueError):
+        asyncio.run(TextExtractor().extract(str(tmp_path / "resume.txt")))
+
+
+@pytest.mark.parametrize("raw, cleaned", [
+    ("Jane # Python", "Jane Python"),
+    ("“Jane” ‘Doe’ # Python", "\"Jane\" 'Doe' Python"),
+    ("jane @ example.com   and  more", "jane@example.com and more"),
+])
+def test_clean_latex_artifacts(raw, cleaned):
+    assert TextExtractor()._clean_latex_artifacts(raw) == cleaned
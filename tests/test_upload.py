@@ -0,0 +1,98 @@
+# tests/test_upload.py
+"""
+Tests for the upload endpoint and background resume processing
+"""
+import asyncio
+
+import pytest
+
+from app.routes import upload
+
+
+class FakeFileService:
+    def __init__(self, text="Jane Doe\nPython developer", error=None):
+        self.text = text
+        self.error = error
+    
+    async def extract_text(self, file_path):
+        await asyncio.sleep(0)  # let the MongoDB warm-up start
+        if self.error:
+            raise self.error
+        return self.text
+
+
+class FakeGroqService:
+    async def extract_resume_info(self, text):
+        return {"introduction": text.splitlines()[0], "skills": ["Python"]}
+    
+    def precompute_canned_answers(self, data):
+        return {"skills": ", ".join(data["skills"])}
+    
+    def precompute_context(self, data):
+        return f"Name: {data['introduction']}"
+
+
+class FakeMongoDB:
+    def __init__(self, ping_delay=0):
+        self.candidates = []
+        self.ping_delay = ping_delay
+        self.ping_cancelled = False
+    
+    async def ping(self):
+        try:
+            await asyncio.sleep(self.ping_delay)
+        except asyncio.CancelledError:
+            self.ping_cancelled = True
+            raise
+        return True
+    
+    async def create_candidate(self, candidate_data):
+        self.candidates.append(candidate_data)
+        return candidate_data["candidate_id"]
+
+
+@pytest.fixture
+def services(monkeypatch):
+    """Point the background task at fakes; returns a setter for them"""
+    def use(file_service, mongodb):
+        monkeypatch.setattr(upload, "get_file_service", lambda: file_service)
+        monkeypatch.setattr(upload, "get_hf_service", FakeGroqService)
+        monkeypatch.setattr(upload, "get_mongodb_service", lambda: mongodb)
+    return use
+
+
+def test_process_resume_background(services, tmp_path):
+    resume = tmp_path / "resume.pdf"
+    resume.write_bytes(b"%PDF")
+    mongodb = FakeMongoDB()
+    services(FakeFileService(), mongodb)
+    
+    asyncio.run(upload.process_resume_background(str(resume), "meta-1", "resume.pdf"))
+    
+    assert mongodb.candidates == [
+        {
+            "introduction": "Jane Doe",
+            "skills": ["Python"],
+            "candidate_id": "meta-1",
+            "_canned": {"skills": "Python"},
+            "_context": "Name: Jane Doe",
+        }
+    ]
+    assert not resume.exists()
+
+
+def test_process_resume_background_failure_cancels_warmup(services, tmp_path):
+    resume = tmp_path / "resume.pdf"
+    resume.write_bytes(b"%PDF")
+    mongodb = FakeMongoDB(ping_delay=5)
+    services(FakeFileService(error=ValueError("corrupt file")), mongodb)
+    
+    async def run():
+        await upload.process_resume_background(str(resume), "meta-1", "resume.pdf")
+        await asyncio.sleep(0)  # let the cancellation land
+        # Checked before asyncio.run() cancels leftover tasks itself
+        return mongodb.ping_cancelled
+    
+    assert asyncio.run(run())
+    assert mongodb.candidates == []
+    assert not resume.exists()